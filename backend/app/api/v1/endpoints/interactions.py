@@ -1,11 +1,11 @@
 """Interactions API endpoints."""
 
-import math
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response, status
 from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
 
 from app.api.v1.schemas.requests import BatchRequest, SaveNetworkLogRequest, SendPromptRequest
 from app.api.v1.schemas.responses import (
@@ -35,11 +35,38 @@ from app.services.provider_service import ProviderService
 
 router = APIRouter(prefix="/interactions", tags=["interactions"])
 
+# Routes that hit the (synchronous) SQLAlchemy session or provider SDKs are
+# plain ``def`` so FastAPI runs them in its threadpool instead of blocking the
+# event loop; the batch routes stay async because they only touch in-memory
+# job state and schedule work on the loop.
+
+
+# Success statuses shared by a route's decorator and its _model_json_response call.
+_BATCH_STARTED_STATUS = status.HTTP_202_ACCEPTED
+_NETWORK_LOG_SAVED_STATUS = status.HTTP_201_CREATED
+
+
+def _model_json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+  """Serialize an already-built response model straight to JSON in pydantic-core.
+
+  Returning a Response skips FastAPI's dump -> re-validate -> jsonable_encoder ->
+  json.dumps pipeline for response_model routes, which dominates the cost of the
+  deeply nested interaction payloads. The model's schema serializer emits bytes
+  directly, avoiding the str round trip of model_dump_json.
+
+  Because a raw Response is returned, FastAPI ignores the route's
+  ``status_code`` and skips ``response_model`` filtering: response_model only
+  drives the OpenAPI docs now. Routes that don't return 200 pass the same
+  module constant to the decorator and here, so the two can't drift apart.
+  """
+  content = model.__pydantic_serializer__.to_json(model)
+  return Response(content=content, status_code=status_code, media_type="application/json")
+
 
 @router.post(
   "/batch",
   response_model=BatchStatus,
-  status_code=status.HTTP_202_ACCEPTED,
+  status_code=_BATCH_STARTED_STATUS,
   summary="Start backend-managed batch processing",
   description="Submit prompts and models for asynchronous batch execution. "
   "Use GET /interactions/batch/{batch_id} to poll status as results complete.",
@@ -50,7 +77,7 @@ async def start_batch(
 ):
   """Start a backend-managed batch job."""
   try:
-    return await batch_service.start_batch(request)
+    return _model_json_response(await batch_service.start_batch(request), _BATCH_STARTED_STATUS)
   except ValueError as exc:
     raise InvalidRequestError(str(exc))
 
@@ -68,7 +95,7 @@ async def get_batch_status(
 ):
   """Return current status/results for a batch job."""
   try:
-    return batch_service.get_status(batch_id)
+    return _model_json_response(batch_service.get_status(batch_id))
   except ValueError:
     raise InteractionNotFoundError(batch_id)
 
@@ -86,7 +113,7 @@ async def cancel_batch(
 ):
   """Cancel a backend-managed batch job."""
   try:
-    return batch_service.cancel_batch(batch_id)
+    return _model_json_response(batch_service.cancel_batch(batch_id))
   except ValueError:
     raise InteractionNotFoundError(batch_id)
 
@@ -182,7 +209,7 @@ async def cancel_batch(
     }
   }
 )
-async def send_prompt(
+def send_prompt(
   request: SendPromptRequest,
   provider_service: ProviderService = Depends(get_provider_service),
 ):
@@ -206,7 +233,7 @@ async def send_prompt(
       model=request.model,
       save_to_db=True
     )
-    return response
+    return _model_json_response(response)
   except ValueError as e:
     # Parse ValueError to determine specific error type
     error_msg = str(e).lower()
@@ -231,7 +258,7 @@ async def send_prompt(
 @router.post(
   "/save-network-log",
   response_model=SendPromptResponse,
-  status_code=status.HTTP_201_CREATED,
+  status_code=_NETWORK_LOG_SAVED_STATUS,
   summary="Save web capture data",
   description="Save interaction data captured via the web capture mode (formerly called network log mode). "
   "This endpoint accepts pre-captured data and saves it to the database.",
@@ -264,7 +291,7 @@ async def send_prompt(
     }
   }
 )
-async def save_network_log_data(
+def save_network_log_data(
   request: SaveNetworkLogRequest,
   background_tasks: BackgroundTasks,
   interaction_service: InteractionService = Depends(get_interaction_service),
@@ -301,6 +328,8 @@ async def save_network_log_data(
       raw_response=request.raw_response,
       extra_links_count=request.extra_links_count,
       enable_citation_tagging=request.enable_citation_tagging,
+      # NetworkLogSource/NetworkLogCitation already ran dump_metadata on these.
+      metadata_validated=True,
     )
 
     try:
@@ -310,7 +339,7 @@ async def save_network_log_data(
       if status_value == "queued":
         response_id = getattr(response, "interaction_id", None)
         if not isinstance(response_id, int):
-          return response
+          return _model_json_response(response, _NETWORK_LOG_SAVED_STATUS)
         # Run in a background thread to avoid blocking the request.
         background_tasks.add_task(
           enqueue_web_citation_tagging,
@@ -323,7 +352,7 @@ async def save_network_log_data(
       import logging
       logging.getLogger(__name__).exception("Failed to enqueue citation tagging job")
 
-    return response
+    return _model_json_response(response, _NETWORK_LOG_SAVED_STATUS)
   except ValueError as e:
     from app.core.exceptions import InvalidRequestError
     raise InvalidRequestError(str(e))
@@ -340,7 +369,7 @@ async def save_network_log_data(
   description="Get a paginated list of recent interactions with summary information. "
   "Supports filtering by data source, provider, model, and date range.",
 )
-async def get_recent_interactions(
+def get_recent_interactions(
   page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
   page_size: int = Query(
     default=10,
@@ -406,25 +435,18 @@ async def get_recent_interactions(
     date_to=date_to
   )
 
-  # Calculate pagination metadata
-  total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
-  has_next = page < total_pages
-  has_prev = page > 1
-
+  # total_pages/has_next/has_prev are computed by PaginationMeta on serialization
   pagination = PaginationMeta(
     page=page,
     page_size=page_size,
     total_items=total_count,
-    total_pages=total_pages,
-    has_next=has_next,
-    has_prev=has_prev
   )
 
-  return PaginatedInteractionList(
+  return _model_json_response(PaginatedInteractionList.from_trusted(
     items=interactions,
     pagination=pagination,
     stats=stats
-  )
+  ))
 
 
 @router.get(
@@ -469,7 +491,7 @@ async def get_recent_interactions(
     }
   }
 )
-async def get_interaction_details(
+def get_interaction_details(
   interaction_id: int,
   interaction_service: InteractionService = Depends(get_interaction_service),
 ):
@@ -489,7 +511,7 @@ async def get_interaction_details(
   interaction = interaction_service.get_interaction_details(interaction_id)
   if not interaction:
     raise InteractionNotFoundError(interaction_id)
-  return interaction
+  return _model_json_response(interaction)
 
 
 @router.get(
@@ -534,7 +556,7 @@ async def get_interaction_details(
     }
   }
 )
-async def export_interaction_markdown(
+def export_interaction_markdown(
   interaction_id: int,
   export_service: ExportService = Depends(get_export_service),
 ):
@@ -595,7 +617,7 @@ async def export_interaction_markdown(
     }
   }
 )
-async def delete_interaction(
+def delete_interaction(
   interaction_id: int,
   interaction_service: InteractionService = Depends(get_interaction_service),
 ):
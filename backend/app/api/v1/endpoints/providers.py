@@ -2,7 +2,8 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from app.api.v1.schemas.responses import ModelInfoResponse, ProviderInfo
 from app.dependencies import get_provider_service
@@ -10,6 +11,17 @@ from app.services.provider_service import ProviderService
 
 router = APIRouter(prefix="/providers", tags=["providers"])
 
+# List serializers are built once at import; routes emit JSON bytes directly
+# instead of going through FastAPI's response_model re-validation per call.
+_PROVIDER_LIST_ADAPTER = TypeAdapter(List[ProviderInfo])
+_MODEL_LIST_ADAPTER = TypeAdapter(List[str])
+_MODEL_INFO_LIST_ADAPTER = TypeAdapter(List[ModelInfoResponse])
+
+
+def _json_list_response(adapter: TypeAdapter, items: list) -> Response:
+  """Serialize a list payload with a cached TypeAdapter."""
+  return Response(content=adapter.dump_json(items), media_type="application/json")
+
 
 @router.get(
   "",
@@ -35,7 +47,7 @@ async def get_providers(
   """
   try:
     providers = provider_service.get_available_providers()
-    return providers
+    return _json_list_response(_PROVIDER_LIST_ADAPTER, providers)
   except Exception as e:
     raise HTTPException(
       status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -66,7 +78,7 @@ async def get_all_models(
   """
   try:
     models = provider_service.get_available_models()
-    return models
+    return _json_list_response(_MODEL_LIST_ADAPTER, models)
   except Exception as e:
     raise HTTPException(
       status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -93,7 +105,7 @@ async def get_all_model_info(
     List of model metadata objects.
   """
   try:
-    return provider_service.get_available_model_info()
+    return _json_list_response(_MODEL_INFO_LIST_ADAPTER, provider_service.get_available_model_info())
   except Exception as e:
     raise HTTPException(
       status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -17,27 +17,60 @@ The schemas enforce:
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 from pydantic import (
   AliasChoices,
   BaseModel,
   ConfigDict,
   Field,
+  StringConstraints,
   field_validator,
   model_validator,
 )
 
 from app.core.json_schemas import CitationMetadata, SourceMetadata, dump_metadata
 
+# Allowed values are hoisted so the validation happy path allocates nothing;
+# the joined messages are only referenced when a value is rejected.
+_VALID_PROVIDERS = frozenset(("openai", "google", "anthropic", "chatgpt"))
+_VALID_PROVIDERS_MSG = "openai, google, anthropic, chatgpt"
+_VALID_DATA_MODES = frozenset(("api", "web", "network_log"))
+_VALID_DATA_MODES_MSG = "api, web, network_log"
+
+_SCRIPT_TAG_RE = re.compile(r"<script.*?>.*?</script>", re.IGNORECASE | re.DOTALL)
+_DANGEROUS_TAG_RES = tuple(
+  (tag, re.compile(rf"<{tag}.*?>", re.IGNORECASE))
+  for tag in ("iframe", "object", "embed", "link", "style")
+)
+
+
+def _normalize_provider(v: str) -> str:
+  """Return the canonical lowercase provider name or raise ValueError."""
+  # Well-behaved clients already send lowercase names; skip the lower() copy.
+  if v in _VALID_PROVIDERS:
+    return v
+  v_lower = v.lower()
+  if v_lower not in _VALID_PROVIDERS:
+    raise ValueError(f"Invalid provider '{v}'. Must be one of: {_VALID_PROVIDERS_MSG}")
+  return v_lower
+
+
+def _normalize_data_mode(v: str) -> str:
+  """Return the canonical data mode ('network_log' maps to 'web') or raise ValueError."""
+  v_lower = v if v in _VALID_DATA_MODES else v.lower()
+  if v_lower not in _VALID_DATA_MODES:
+    raise ValueError(f"Invalid data_mode '{v}'. Must be one of: {_VALID_DATA_MODES_MSG}")
+  return "web" if v_lower == "network_log" else v_lower
+
 
 class SendPromptRequest(BaseModel):
   """Request schema for sending a prompt to an LLM provider."""
 
-  prompt: str = Field(
+  # Stripping and the length cap run in pydantic-core; the empty check stays in
+  # validate_prompt so whitespace-only prompts keep their dedicated message.
+  prompt: Annotated[str, StringConstraints(strip_whitespace=True, max_length=10000)] = Field(
     ...,
-    min_length=1,
-    max_length=10000,
     description="The prompt text to send to the LLM",
     examples=["What are the latest developments in AI?"]
   )
@@ -69,21 +102,17 @@ class SendPromptRequest(BaseModel):
   @classmethod
   def validate_prompt(cls, v: str) -> str:
     """Validate prompt for XSS and basic security."""
-    # Remove leading/trailing whitespace
-    v = v.strip()
-
-    # Check for empty prompt after stripping
+    # Value arrives already stripped by StringConstraints
     if not v:
       raise ValueError("Prompt cannot be empty or whitespace only")
 
     # Basic XSS prevention - check for script tags
-    if re.search(r"<script.*?>.*?</script>", v, re.IGNORECASE | re.DOTALL):
+    if _SCRIPT_TAG_RE.search(v):
       raise ValueError("Prompt contains disallowed script tags")
 
     # Check for other potentially dangerous HTML tags
-    dangerous_tags = ["iframe", "object", "embed", "link", "style"]
-    for tag in dangerous_tags:
-      if re.search(rf"<{tag}.*?>", v, re.IGNORECASE):
+    for tag, pattern in _DANGEROUS_TAG_RES:
+      if pattern.search(v):
         raise ValueError(f"Prompt contains disallowed tag: {tag}")
 
     return v
@@ -92,25 +121,13 @@ class SendPromptRequest(BaseModel):
   @classmethod
   def validate_provider(cls, v: str) -> str:
     """Validate provider name."""
-    valid_providers = ["openai", "google", "anthropic", "chatgpt"]
-    v_lower = v.lower()
-    if v_lower not in valid_providers:
-      raise ValueError(
-        f"Invalid provider '{v}'. Must be one of: {', '.join(valid_providers)}"
-      )
-    return v_lower
+    return _normalize_provider(v)
 
   @field_validator("data_mode")
   @classmethod
   def validate_data_mode(cls, v: str) -> str:
     """Validate data collection mode."""
-    valid_modes = ["api", "web", "network_log"]
-    v_lower = v.lower()
-    if v_lower not in valid_modes:
-      raise ValueError(
-        f"Invalid data_mode '{v}'. Must be one of: {', '.join(valid_modes)}"
-      )
-    return "web" if v_lower == "network_log" else v_lower
+    return _normalize_data_mode(v)
 
   @model_validator(mode='after')
   def validate_provider_model_match(self) -> 'SendPromptRequest':
@@ -151,6 +168,16 @@ class SendPromptRequest(BaseModel):
   }
 
 
+def _clean_batch_prompt(index: int, prompt: str) -> str:
+  """Strip and validate a single batch prompt, reporting its list index on error."""
+  prompt = prompt.strip()
+  if not prompt:
+    raise ValueError(f"Prompt at index {index} is empty or whitespace only")
+  if len(prompt) > 10000:
+    raise ValueError(f"Prompt at index {index} exceeds maximum length of 10000 characters")
+  return prompt
+
+
 class BatchRequest(BaseModel):
   """Request schema for batch processing multiple prompts."""
 
@@ -183,41 +210,14 @@ class BatchRequest(BaseModel):
   @field_validator("prompts")
   @classmethod
   def validate_prompts(cls, v: List[str]) -> List[str]:
-    """Validate each prompt in the list."""
-    if not v:
-      raise ValueError("Prompts list cannot be empty")
-
-    # Validate each prompt
-    validated_prompts = []
-    for i, prompt in enumerate(v):
-      prompt = prompt.strip()
-      if not prompt:
-        raise ValueError(f"Prompt at index {i} is empty or whitespace only")
-      if len(prompt) > 10000:
-        raise ValueError(f"Prompt at index {i} exceeds maximum length of 10000 characters")
-      validated_prompts.append(prompt)
-
-    return validated_prompts
-
-  @field_validator("models")
-  @classmethod
-  def validate_models(cls, v: List[str]) -> List[str]:
-    """Validate models list."""
-    if not v:
-      raise ValueError("Models list cannot be empty")
-    return v
+    """Validate each prompt in the list (non-empty list is enforced by min_length)."""
+    return [_clean_batch_prompt(i, prompt) for i, prompt in enumerate(v)]
 
   @field_validator("data_mode")
   @classmethod
   def validate_data_mode(cls, v: str) -> str:
     """Validate data collection mode."""
-    valid_modes = ["api", "web", "network_log"]
-    v_lower = v.lower()
-    if v_lower not in valid_modes:
-      raise ValueError(
-        f"Invalid data_mode '{v}'. Must be one of: {', '.join(valid_modes)}"
-      )
-    return "web" if v_lower == "network_log" else v_lower
+    return _normalize_data_mode(v)
 
   model_config = {
     "json_schema_extra": {
@@ -321,16 +321,6 @@ class NetworkLogSearchQuery(BaseModel):
     description="List of reformulated queries (if provided)"
   )
 
-  @field_validator("internal_ranking_scores")
-  @classmethod
-  def validate_internal_scores(cls, value: Optional[Dict[str, Any]]):
-    """Validate internal ranking scores are a dictionary."""
-    if value is None:
-      return None
-    if not isinstance(value, dict):
-      raise ValueError("internal_ranking_scores must be an object")
-    return value
-
 
 class SaveNetworkLogRequest(BaseModel):
   """Request schema for saving network_log mode data captured by frontend."""
@@ -401,13 +391,7 @@ class SaveNetworkLogRequest(BaseModel):
   @classmethod
   def validate_provider(cls, v: str) -> str:
     """Validate provider name."""
-    valid_providers = ["openai", "google", "anthropic", "chatgpt"]
-    v_lower = v.lower()
-    if v_lower not in valid_providers:
-      raise ValueError(
-        f"Invalid provider '{v}'. Must be one of: {', '.join(valid_providers)}"
-      )
-    return v_lower
+    return _normalize_provider(v)
 
   model_config = {
     "json_schema_extra": {
@@ -20,51 +20,58 @@ The schemas ensure:
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, SkipValidation, computed_field, model_validator
 
+# Pass-through JSON blobs (raw provider payloads, metadata, ranking scores) are
+# already validated when they are written, either by the provider schemas or by
+# the request models. Rebuilding the response should not copy and re-check them
+# again. Serialization and the OpenAPI schema still use the dict type.
+_PassThroughDict = SkipValidation[Optional[Dict[str, Any]]]
 
-def _empty_source_list() -> List[Source]:
-  """Return a new list for source fields."""
-  return []
 
+class _TrustedResponseModel(BaseModel):
+  """Base for response schemas that are also rebuilt from persisted rows."""
 
-def _empty_search_query_list() -> List[SearchQuery]:
-  """Return a new list for search query fields."""
-  return []
+  @classmethod
+  def from_trusted(cls, **data: Any):
+    """Build the schema from already-validated data without re-running validators.
 
+    Rows read back from the database were validated when they were written, so
+    the read path skips the per-field validator chain. Defaults are still
+    applied and ``model_validator`` hooks do not run, so callers must pass
+    fully-formed values.
 
-def _empty_citation_list() -> List[Citation]:
-  """Return a new list for citation fields."""
-  return []
+    Args:
+      **data: Field values for the schema.
 
+    Returns:
+      Schema instance built via model_construct.
+    """
+    return cls.model_construct(**data)
 
-def _empty_tag_list() -> List[str]:
-  """Return a new list for tag fields."""
-  return []
 
-
-class CitationMention(BaseModel):
+class CitationMention(_TrustedResponseModel):
   """One mention of a citation in the response (one cited span/snippet)."""
 
   mention_index: int = Field(..., ge=0, description="0-indexed mention order for this citation")
   start_index: Optional[int] = Field(None, ge=0, description="Start offset of cited text")
   end_index: Optional[int] = Field(None, ge=0, description="End offset of cited text")
   snippet_cited: Optional[str] = Field(None, description="Exact snippet cited for this mention")
-  metadata: Optional[Dict[str, Any]] = Field(None, description="Additional mention metadata")
+  metadata: _PassThroughDict = Field(None, description="Additional mention metadata")
 
   function_tags: List[str] = Field(
-    default_factory=_empty_tag_list,
+    default_factory=list,
     description="Functional roles applied to this mention"
   )
   stance_tags: List[str] = Field(
-    default_factory=_empty_tag_list,
+    default_factory=list,
     description="Stance annotations for this mention"
   )
   provenance_tags: List[str] = Field(
-    default_factory=_empty_tag_list,
+    default_factory=list,
     description="Provenance annotations for this mention"
   )
   influence_summary: Optional[str] = Field(
@@ -73,12 +80,7 @@ class CitationMention(BaseModel):
   )
 
 
-def _empty_citation_mention_list() -> List[CitationMention]:
-  """Return a new list for citation mention fields."""
-  return []
-
-
-class Source(BaseModel):
+class Source(_TrustedResponseModel):
   """Source/URL fetched during search."""
 
   url: str = Field(..., description="Source URL")
@@ -97,7 +99,7 @@ class Source(BaseModel):
     description="Deprecated alias for search_description",
   )
   internal_score: Optional[float] = Field(None, description="Internal relevance score")
-  metadata: Optional[Dict[str, Any]] = Field(None, description="Full metadata from logs")
+  metadata: _PassThroughDict = Field(None, description="Full metadata from logs")
 
   @model_validator(mode="after")
   def _sync_description_alias(self) -> "Source":
@@ -123,16 +125,16 @@ class Source(BaseModel):
   }
 
 
-class SearchQuery(BaseModel):
+class SearchQuery(_TrustedResponseModel):
   """Search query made during response generation."""
 
   query: str = Field(..., description="The search query text")
-  sources: List[Source] = Field(default_factory=_empty_source_list, description="Sources found for this query")
+  sources: List[Source] = Field(default_factory=list, description="Sources found for this query")
   timestamp: Optional[str] = Field(None, description="When the query was made")
   order_index: int = Field(default=0, ge=0, description="Order in the query sequence")
 
   # Network log exclusive fields
-  internal_ranking_scores: Optional[Dict[str, Any]] = Field(
+  internal_ranking_scores: _PassThroughDict = Field(
     None,
     description="Internal ranking scores from logs"
   )
@@ -154,7 +156,7 @@ class SearchQuery(BaseModel):
   }
 
 
-class Citation(BaseModel):
+class Citation(_TrustedResponseModel):
   """Citation/source actually used in the response."""
 
   url: str = Field(..., description="Citation URL")
@@ -173,20 +175,20 @@ class Citation(BaseModel):
     le=1.0,
     description="Citation confidence score"
   )
-  metadata: Optional[Dict[str, Any]] = Field(
+  metadata: _PassThroughDict = Field(
     None,
     description="Additional citation metadata"
   )
   function_tags: List[str] = Field(
-    default_factory=_empty_tag_list,
+    default_factory=list,
     description="Functional roles applied to this citation"
   )
   stance_tags: List[str] = Field(
-    default_factory=_empty_tag_list,
+    default_factory=list,
     description="Stance annotations describing how the citation relates to the claim"
   )
   provenance_tags: List[str] = Field(
-    default_factory=_empty_tag_list,
+    default_factory=list,
     description="Provenance annotations derived from citation metadata"
   )
   influence_summary: Optional[str] = Field(
@@ -194,7 +196,7 @@ class Citation(BaseModel):
     description="Short summary describing how the source influenced the claim"
   )
   mentions: List[CitationMention] = Field(
-    default_factory=_empty_citation_mention_list,
+    default_factory=list,
     description="All cited snippets/mentions for this URL within the response"
   )
 
@@ -211,22 +213,26 @@ class Citation(BaseModel):
   }
 
 
-class SendPromptResponse(BaseModel):
-  """Full response from sending a prompt to an LLM."""
+class SendPromptResponseCore(_TrustedResponseModel):
+  """Display fields of a prompt response, without the raw payload blobs.
+
+  Used where many responses are returned at once (batch status polling) so the
+  heavy raw_response/metadata blobs are never serialized.
+  """
 
   # Core response data
   prompt: str = Field(..., description="The original prompt text")
   response_text: str = Field(..., description="The LLM's response text")
   search_queries: List[SearchQuery] = Field(
-    default_factory=_empty_search_query_list,
+    default_factory=list,
     description="Search queries made during generation"
   )
   citations: List[Citation] = Field(
-    default_factory=_empty_citation_list,
+    default_factory=list,
     description="Citations used in the response"
   )
-  all_sources: Optional[List[Source]] = Field(
-    default_factory=_empty_source_list,
+  all_sources: List[Source] = Field(
+    default_factory=list,
     description=(
       "All sources aggregated from all search queries (API mode) or directly "
       "from response (web capture mode). Always populated for consistent "
@@ -270,9 +276,13 @@ class SendPromptResponse(BaseModel):
   interaction_id: Optional[int] = Field(None, description="Database interaction ID")
   created_at: Optional[datetime] = Field(None, description="When the interaction was created")
 
+
+class SendPromptResponse(SendPromptResponseCore):
+  """Full response from sending a prompt to an LLM."""
+
   # Raw data
-  raw_response: Optional[Dict[str, Any]] = Field(None, description="Raw API response")
-  metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+  raw_response: _PassThroughDict = Field(None, description="Raw API response")
+  metadata: _PassThroughDict = Field(None, description="Additional metadata")
 
   model_config = {
     "json_schema_extra": {
@@ -296,7 +306,7 @@ class SendPromptResponse(BaseModel):
   }
 
 
-class InteractionSummary(BaseModel):
+class InteractionSummary(_TrustedResponseModel):
   """Summary of an interaction for list views."""
 
   interaction_id: int = Field(..., description="Database interaction ID")
@@ -399,9 +409,25 @@ class PaginationMeta(BaseModel):
   page: int = Field(..., ge=1, description="Current page number (1-indexed)")
   page_size: int = Field(..., ge=1, le=100, description="Number of items per page")
   total_items: int = Field(..., ge=0, description="Total number of items across all pages")
-  total_pages: int = Field(..., ge=0, description="Total number of pages")
-  has_next: bool = Field(..., description="Whether there is a next page available")
-  has_prev: bool = Field(..., description="Whether there is a previous page available")
+
+  # Derived values are computed at serialization time instead of being validated fields.
+  @computed_field(description="Total number of pages")  # type: ignore[prop-decorator]
+  @property
+  def total_pages(self) -> int:
+    """Total number of pages for the current page size."""
+    return -(-self.total_items // self.page_size)
+
+  @computed_field(description="Whether there is a next page available")  # type: ignore[prop-decorator]
+  @property
+  def has_next(self) -> bool:
+    """Whether a page exists after the current one."""
+    return self.page < self.total_pages
+
+  @computed_field(description="Whether there is a previous page available")  # type: ignore[prop-decorator]
+  @property
+  def has_prev(self) -> bool:
+    """Whether a page exists before the current one."""
+    return self.page > 1
 
   model_config = {
     "json_schema_extra": {
@@ -419,7 +445,7 @@ class PaginationMeta(BaseModel):
   }
 
 
-class PaginatedInteractionList(BaseModel):
+class PaginatedInteractionList(_TrustedResponseModel):
   """Paginated list of interaction summaries."""
 
   items: List[InteractionSummary] = Field(
@@ -484,9 +510,9 @@ class BatchStatus(BaseModel):
     description="Reason provided when the batch was cancelled"
   )
 
-  results: List[SendPromptResponse] = Field(
+  results: List[SendPromptResponseCore] = Field(
     default_factory=list,
-    description="Completed results"
+    description="Completed results (raw_response and metadata are omitted)"
   )
   errors: List[Dict[str, Any]] = Field(
     default_factory=list,
@@ -571,9 +597,11 @@ class HealthResponse(BaseModel):
   status: str = Field(..., description="Health status (healthy/unhealthy)")
   version: str = Field(..., description="API version")
   database: str = Field(..., description="Database connection status")
-  timestamp: datetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
+  timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Check timestamp")
 
+  # Not returned by any route today; build the schema on first use, not at import.
   model_config = {
+    "defer_build": True,
     "json_schema_extra": {
       "examples": [
         {
@@ -595,7 +623,9 @@ class ErrorResponse(BaseModel):
   detail: Optional[str] = Field(None, description="Detailed error information")
   code: Optional[str] = Field(None, description="Error code")
 
+  # Not returned by any route today; build the schema on first use, not at import.
   model_config = {
+    "defer_build": True,
     "json_schema_extra": {
       "examples": [
         {
@@ -23,6 +23,9 @@ Example:
     print(settings.DATABASE_URL)
     print(settings.OPENAI_API_KEY)
 
+    # Or, as a FastAPI dependency (returns the same cached instance)
+    def endpoint(settings: Settings = Depends(get_settings)): ...
+
 Database URL Normalization:
     The DATABASE_URL validator handles legacy path formats and ensures
     compatibility between Docker environments (/app/data) and local
@@ -30,17 +33,34 @@ Database URL Normalization:
 """
 
 import logging
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DB_URL = "sqlite:////app/data/llm_search.db"
-BACKEND_FALLBACK_PATH = Path(__file__).resolve().parent.parent / "data" / "llm_search.db"
+APP_DB_PATH = Path("/app/data/llm_search.db")
+LEGACY_DB_URLS = frozenset({
+  "sqlite:///../data/llm_search.db",
+  "sqlite:///./data/llm_search.db",
+  "sqlite:///./backend/data/llm_search.db",
+  "sqlite:////app/data/llm_search.db",
+})
+BACKEND_FALLBACK_PATH = Path(__file__).absolute().parent.parent / "data" / "llm_search.db"
 BACKEND_FALLBACK_URL = f"sqlite:///{BACKEND_FALLBACK_PATH.as_posix()}"
 
 
+@lru_cache(maxsize=1)
+def _app_db_path_exists() -> bool:
+  """Return whether the Docker database path exists, checked once per process."""
+  return APP_DB_PATH.exists()
+
+
 class Settings(BaseSettings):
   """Application configuration settings using Pydantic Settings.
 
@@ -56,6 +76,10 @@ class Settings(BaseSettings):
     PORT: Server port number
     CORS_ORIGINS: Allowed CORS origins for frontend access
     DATABASE_URL: SQLite or PostgreSQL connection URL
+    DB_POOL_SIZE: Connection pool size for non-SQLite databases
+    DB_MAX_OVERFLOW: Connections allowed beyond the pool size
+    DB_POOL_RECYCLE: Seconds before pooled connections are recycled
+    DB_POOL_TIMEOUT: Seconds to wait for a pooled connection before erroring
     OPENAI_API_KEY: OpenAI API key for GPT models
     GOOGLE_API_KEY: Google API key for Gemini models
     ANTHROPIC_API_KEY: Anthropic API key for Claude models
@@ -63,6 +87,7 @@ class Settings(BaseSettings):
     NETWORK_LOGS_DIR: Directory for storing network capture logs
     BROWSER_HEADLESS: Run browser in headless mode for network capture
     LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    ENABLE_REQUEST_LOGGING: Log each request; correlation IDs are added either way
   """
 
   # Application settings
@@ -75,8 +100,8 @@ class Settings(BaseSettings):
   PORT: int = 8000
 
   # CORS settings
-  CORS_ORIGINS: List[str] = Field(
-    default=["http://localhost:8501", "http://localhost:3000"],
+  CORS_ORIGINS: Tuple[str, ...] = Field(
+    default=("http://localhost:8501", "http://localhost:3000"),
     description="Allowed CORS origins (Streamlit and React)"
   )
 
@@ -86,6 +111,12 @@ class Settings(BaseSettings):
     description="SQLite database URL (stored in /app/data/llm_search.db)"
   )
 
+  # Connection pool settings (ignored for SQLite, which uses its own pooling)
+  DB_POOL_SIZE: int = Field(default=10, description="Persistent connections kept in the pool")
+  DB_MAX_OVERFLOW: int = Field(default=20, description="Extra connections allowed above DB_POOL_SIZE")
+  DB_POOL_RECYCLE: int = Field(default=1800, description="Seconds before a pooled connection is recycled")
+  DB_POOL_TIMEOUT: int = Field(default=30, description="Seconds to wait for a free pooled connection")
+
   # API Keys for LLM providers
   OPENAI_API_KEY: str = Field(default="", description="OpenAI API key")
   GOOGLE_API_KEY: str = Field(default="", description="Google API key")
@@ -112,6 +143,10 @@ class Settings(BaseSettings):
     default="INFO",
     description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
   )
+  ENABLE_REQUEST_LOGGING: bool = Field(
+    default=True,
+    description="Log every request/response (correlation IDs are always added)"
+  )
   ENABLE_CITATION_TAGGING: bool = Field(
     default=False,
     description="Enable LLM-based citation tagging for web captures"
@@ -167,17 +202,8 @@ class Settings(BaseSettings):
     resolves to the removed root-level data directory. This guard keeps
     deployments pointed at backend/data even if the env var wasn't updated.
     """
-    logger = logging.getLogger(__name__)
-
     candidate = value
-    legacy_paths = {
-      "sqlite:///../data/llm_search.db",
-      "sqlite:///./data/llm_search.db",
-      "sqlite:///./backend/data/llm_search.db",
-      "sqlite:////app/data/llm_search.db",
-    }
-
-    if isinstance(value, str) and value in legacy_paths:
+    if isinstance(value, str) and value in LEGACY_DB_URLS:
       logger.warning(
         "DATABASE_URL=%s detected; normalizing to %s so backend and frontend share the same database location",
         value,
@@ -186,8 +212,7 @@ class Settings(BaseSettings):
       candidate = DEFAULT_DB_URL
 
     if isinstance(candidate, str) and candidate == DEFAULT_DB_URL:
-      app_path = Path("/app/data/llm_search.db")
-      if not app_path.exists():
+      if not _app_db_path_exists():
         logger.info(
           "/app/data/llm_search.db not found; falling back to %s",
           BACKEND_FALLBACK_URL,
@@ -195,15 +220,45 @@ class Settings(BaseSettings):
         return BACKEND_FALLBACK_URL
     return candidate
 
-  def get_batch_provider_limits(self) -> Dict[str, int]:
-    """Return per-provider concurrency limits, applying overrides when set."""
+  @cached_property
+  def cors_origins_set(self) -> FrozenSet[str]:
+    """CORS origins as a frozenset for constant-time membership checks."""
+    return frozenset(self.CORS_ORIGINS)
+
+  @cached_property
+  def batch_provider_limits(self) -> Mapping[str, int]:
+    """Per-provider concurrency limits, applying overrides when set.
+
+    Computed once per instance and returned as a read-only mapping so the
+    cached value can be shared safely between callers.
+    """
     base = self.BATCH_PER_PROVIDER_CONCURRENCY
-    return {
+    return MappingProxyType({
       "openai": self.BATCH_MAX_CONCURRENCY_OPENAI or base,
       "google": self.BATCH_MAX_CONCURRENCY_GOOGLE or base,
       "anthropic": self.BATCH_MAX_CONCURRENCY_ANTHROPIC or base,
-    }
+    })
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+  """Return the process-wide Settings instance.
+
+  The .env file and environment are read once; later calls (including
+  FastAPI ``Depends(get_settings)``) return the cached instance.
+  """
+  return Settings()
 
 
-# Create global settings instance
-settings = Settings()
+def __getattr__(name: str) -> Settings:
+  """Build the global ``settings`` instance on first access (PEP 562).
+
+  Importing this module for its constants or the Settings class no longer
+  reads the environment or .env file; ``from app.config import settings``
+  builds the instance once and binds it as a regular module attribute.
+  """
+  if name == "settings":
+    instance = get_settings()
+    globals()["settings"] = instance
+    return instance
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,9 +4,11 @@ This module defines a hierarchy of custom exceptions with error codes and
 user-friendly messages for consistent error handling across the application.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from fastapi import status
+from pydantic_core import to_json
 
 
 class APIException(Exception):
@@ -19,34 +21,42 @@ class APIException(Exception):
     message: User-friendly error message
     error_code: Machine-readable error code
     status_code: HTTP status code
-    details: Additional error details (optional)
+    details: Additional error details, or None when there are none
   """
 
+  error_code: str = "INTERNAL_SERVER_ERROR"
+  status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+
   def __init__(
     self,
     message: str,
-    error_code: str,
-    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+    error_code: Optional[str] = None,
+    status_code: Optional[int] = None,
     details: Optional[Dict[str, Any]] = None,
   ):
-    """Initialize base API exception with common error fields."""
+    """Initialize base API exception with common error fields.
+
+    Subclasses declare ``error_code`` and ``status_code`` as class
+    attributes; they are only stored per instance when overridden here.
+    """
     self.message = message
-    self.error_code = error_code
-    self.status_code = status_code
-    self.details = details or {}
+    if error_code is not None:
+      self.error_code = error_code
+    if status_code is not None:
+      self.status_code = status_code
+    self.details = details
     super().__init__(self.message)
 
   def to_dict(self) -> Dict[str, Any]:
     """Convert exception to dictionary for JSON response."""
-    response: Dict[str, Any] = {
-      "error": {
-        "message": self.message,
-        "code": self.error_code,
-      }
-    }
+    error: Dict[str, Any] = {"message": self.message, "code": self.error_code}
     if self.details:
-      response["error"]["details"] = self.details
-    return response
+      error["details"] = self.details
+    return {"error": error}
+
+  def to_json(self) -> bytes:
+    """Serialize the error payload straight to JSON bytes for a response body."""
+    return to_json(self.to_dict())
 
 
 # ============================================================================
@@ -60,14 +70,12 @@ class ValidationError(APIException):
   detects invalid input data.
   """
 
+  error_code = "VALIDATION_ERROR"
+  status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+
   def __init__(self, message: str = "Validation error", details: Optional[Dict[str, Any]] = None):
     """Build validation error with optional detail payload."""
-    super().__init__(
-      message=message,
-      error_code="VALIDATION_ERROR",
-      status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-      details=details,
-    )
+    super().__init__(message=message, details=details)
 
 
 class ResourceNotFoundError(APIException):
@@ -76,12 +84,13 @@ class ResourceNotFoundError(APIException):
   Used when a database query returns no results for a requested ID.
   """
 
+  error_code = "RESOURCE_NOT_FOUND"
+  status_code = status.HTTP_404_NOT_FOUND
+
   def __init__(self, resource_type: str, resource_id: Any):
     """Build not-found error including resource metadata."""
     super().__init__(
       message=f"{resource_type} with ID {resource_id} not found",
-      error_code="RESOURCE_NOT_FOUND",
-      status_code=status.HTTP_404_NOT_FOUND,
       details={"resource_type": resource_type, "resource_id": str(resource_id)},
     )
 
@@ -93,14 +102,12 @@ class InvalidRequestError(APIException):
   by Pydantic validation.
   """
 
+  error_code = "INVALID_REQUEST"
+  status_code = status.HTTP_400_BAD_REQUEST
+
   def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
     """Build invalid-request error with optional detail payload."""
-    super().__init__(
-      message=message,
-      error_code="INVALID_REQUEST",
-      status_code=status.HTTP_400_BAD_REQUEST,
-      details=details,
-    )
+    super().__init__(message=message, details=details)
 
 
 class AuthenticationError(APIException):
@@ -109,13 +116,12 @@ class AuthenticationError(APIException):
   Used when API key or credentials are missing or invalid.
   """
 
+  error_code = "AUTHENTICATION_ERROR"
+  status_code = status.HTTP_401_UNAUTHORIZED
+
   def __init__(self, message: str = "Authentication required"):
     """Build authentication error with a user-friendly message."""
-    super().__init__(
-      message=message,
-      error_code="AUTHENTICATION_ERROR",
-      status_code=status.HTTP_401_UNAUTHORIZED,
-    )
+    super().__init__(message=message)
 
 
 class AuthorizationError(APIException):
@@ -124,13 +130,12 @@ class AuthorizationError(APIException):
   Used when user is authenticated but lacks permission for the resource.
   """
 
+  error_code = "AUTHORIZATION_ERROR"
+  status_code = status.HTTP_403_FORBIDDEN
+
   def __init__(self, message: str = "Insufficient permissions"):
     """Build authorization error describing the missing permission."""
-    super().__init__(
-      message=message,
-      error_code="AUTHORIZATION_ERROR",
-      status_code=status.HTTP_403_FORBIDDEN,
-    )
+    super().__init__(message=message)
 
 
 class RateLimitError(APIException):
@@ -139,15 +144,13 @@ class RateLimitError(APIException):
   Used when user exceeds API rate limits.
   """
 
+  error_code = "RATE_LIMIT_EXCEEDED"
+  status_code = status.HTTP_429_TOO_MANY_REQUESTS
+
   def __init__(self, message: str = "Rate limit exceeded", retry_after: Optional[int] = None):
     """Build rate-limit error optionally including retry-after hint."""
     details = {"retry_after": retry_after} if retry_after else None
-    super().__init__(
-      message=message,
-      error_code="RATE_LIMIT_EXCEEDED",
-      status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-      details=details,
-    )
+    super().__init__(message=message, details=details)
 
 
 # ============================================================================
@@ -160,14 +163,12 @@ class InternalServerError(APIException):
   Used for unexpected errors that aren't caught by more specific handlers.
   """
 
+  error_code = "INTERNAL_SERVER_ERROR"
+  status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
   def __init__(self, message: str = "Internal server error", details: Optional[Dict[str, Any]] = None):
     """Build internal server error with optional details."""
-    super().__init__(
-      message=message,
-      error_code="INTERNAL_SERVER_ERROR",
-      status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-      details=details,
-    )
+    super().__init__(message=message, details=details)
 
 
 class DatabaseError(APIException):
@@ -176,14 +177,12 @@ class DatabaseError(APIException):
   Used when SQLAlchemy raises an exception during database operations.
   """
 
+  error_code = "DATABASE_ERROR"
+  status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
   def __init__(self, message: str = "Database error occurred", details: Optional[Dict[str, Any]] = None):
     """Build database error with optional detail payload."""
-    super().__init__(
-      message=message,
-      error_code="DATABASE_ERROR",
-      status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-      details=details,
-    )
+    super().__init__(message=message, details=details)
 
 
 class ExternalServiceError(APIException):
@@ -192,12 +191,13 @@ class ExternalServiceError(APIException):
   Used when calls to external APIs (LLM providers) fail.
   """
 
+  error_code = "EXTERNAL_SERVICE_ERROR"
+  status_code = status.HTTP_502_BAD_GATEWAY
+
   def __init__(self, service_name: str, message: str, details: Optional[Dict[str, Any]] = None):
     """Build external service error including service metadata."""
     super().__init__(
       message=f"{service_name} error: {message}",
-      error_code="EXTERNAL_SERVICE_ERROR",
-      status_code=status.HTTP_502_BAD_GATEWAY,
       details={**(details or {}), "service": service_name},
     )
 
@@ -208,13 +208,12 @@ class ServiceUnavailableError(APIException):
   Used when the service is down for maintenance or overloaded.
   """
 
+  error_code = "SERVICE_UNAVAILABLE"
+  status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
   def __init__(self, message: str = "Service temporarily unavailable"):
     """Build service-unavailable error with optional message."""
-    super().__init__(
-      message=message,
-      error_code="SERVICE_UNAVAILABLE",
-      status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-    )
+    super().__init__(message=message)
 
 
 class TimeoutError(APIException):
@@ -223,12 +222,13 @@ class TimeoutError(APIException):
   Used when an operation takes too long to complete.
   """
 
+  error_code = "TIMEOUT_ERROR"
+  status_code = status.HTTP_504_GATEWAY_TIMEOUT
+
   def __init__(self, operation: str, timeout_seconds: float):
     """Build timeout error with operation context."""
     super().__init__(
       message=f"{operation} timed out after {timeout_seconds} seconds",
-      error_code="TIMEOUT_ERROR",
-      status_code=status.HTTP_504_GATEWAY_TIMEOUT,
       details={"operation": operation, "timeout": timeout_seconds},
     )
 
@@ -316,7 +316,7 @@ class DataSourceValidationError(ValidationError):
 # Error Code Reference
 # ============================================================================
 
-ERROR_CODE_REFERENCE = {
+ERROR_CODE_REFERENCE: Mapping[str, str] = MappingProxyType({
   # Client Errors (4xx)
   "VALIDATION_ERROR": "Request validation failed - check your input data",
   "RESOURCE_NOT_FOUND": "The requested resource was not found",
@@ -331,4 +331,4 @@ ERROR_CODE_REFERENCE = {
   "EXTERNAL_SERVICE_ERROR": "An external service call failed",
   "SERVICE_UNAVAILABLE": "The service is temporarily unavailable",
   "TIMEOUT_ERROR": "The operation timed out",
-}
+})
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class RefId(BaseModel):
@@ -39,6 +39,18 @@ class CitationMetadata(BaseModel):
   confidence: Optional[float] = None
 
 
+# Adapters are built once at import so per-item validation of large payloads
+# (network-log sources, citations) goes straight to pydantic-core.
+_METADATA_ADAPTERS: Dict[type[BaseModel], TypeAdapter] = {
+  model_cls: TypeAdapter(model_cls) for model_cls in (RefId, SourceMetadata, CitationMetadata)
+}
+
+
+def _metadata_adapter(model_cls: type[BaseModel]) -> TypeAdapter:
+  """Return the prebuilt adapter for a metadata model, building one if unknown."""
+  return _METADATA_ADAPTERS.get(model_cls) or TypeAdapter(model_cls)
+
+
 def dump_metadata(model_cls: type[BaseModel], payload: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
   """Validate and dump metadata dictionaries.
 
@@ -54,7 +66,9 @@ def dump_metadata(model_cls: type[BaseModel], payload: Optional[Dict[str, Any]])
   """
   if payload is None:
     return None
+  adapter = _metadata_adapter(model_cls)
   try:
-    return model_cls.model_validate(payload).model_dump(exclude_none=True)
+    return adapter.dump_python(adapter.validate_python(payload), exclude_none=True)
   except Exception as exc:
     raise ValueError(f"Invalid metadata payload: {exc}") from exc
+
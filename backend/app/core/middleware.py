@@ -2,22 +2,104 @@
 
 This module provides middleware for:
 - Request/response logging with timing
-- Correlation ID tracking across requests
+- Correlation ID tracking across requests (reusing W3C traceparent trace IDs)
 - Request context injection
+
+The middleware is a plain ASGI callable rather than a BaseHTTPMiddleware
+subclass, so requests are not routed through Starlette's per-request
+stream wrapper and no Request/Response objects are built here.
 """
 
 import logging
+import os
 import time
-import uuid
-from typing import Callable
+from contextvars import ContextVar
+from typing import Optional, Tuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+_CORRELATION_HEADER = b"x-correlation-id"
+_USER_AGENT_HEADER = b"user-agent"
+_TRACEPARENT_HEADER = b"traceparent"
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_INVALID_TRACE_ID = "0" * 32
+_NO_CORRELATION_ID = "no-correlation-id"
+
+# Set by the middleware for the duration of a request so services, background
+# tasks and log records can read the ID without a Request object.
+correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default=_NO_CORRELATION_ID)
+
+
+class CorrelationIdFilter(logging.Filter):
+  """Stamp log records with the current request's correlation ID."""
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+  def filter(self, record: logging.LogRecord) -> bool:
+    """Add correlation_id to the log record if not present."""
+    if not hasattr(record, "correlation_id"):
+      record.correlation_id = correlation_id_var.get()
+    return True
+
+
+def _trace_id_from_traceparent(value: bytes) -> Optional[str]:
+  """Return the trace-id of a W3C ``traceparent`` header, or None if it is malformed.
+
+  The header looks like ``00-<32 hex trace-id>-<16 hex parent-id>-<2 hex flags>``.
+  """
+  parts = value.decode("latin-1").strip().split("-")
+  if len(parts) < 4 or len(parts[0]) != 2 or parts[0] == "ff":
+    return None
+  trace_id = parts[1]
+  if len(trace_id) != 32 or trace_id == _INVALID_TRACE_ID or not _HEX_DIGITS.issuperset(trace_id):
+    return None
+  return trace_id
+
+
+def _scan_headers(scope: Scope) -> Tuple[Optional[str], Optional[bytes]]:
+  """Return the correlation ID and raw user-agent from one pass over the ASGI headers.
+
+  An explicit ``X-Correlation-ID`` wins; otherwise the trace-id of a W3C
+  ``traceparent`` header is used so IDs line up with upstream tracing.
+  The user-agent stays undecoded because it is only needed when a request
+  log line is actually emitted.
+  """
+  correlation_id = user_agent = traceparent = None
+  for name, value in scope["headers"]:
+    if name == _CORRELATION_HEADER:
+      correlation_id = value.decode("latin-1")
+    elif name == _USER_AGENT_HEADER:
+      user_agent = value
+    elif name == _TRACEPARENT_HEADER:
+      traceparent = value
+  if not correlation_id and traceparent is not None:
+    correlation_id = _trace_id_from_traceparent(traceparent)
+  return correlation_id, user_agent
+
+
+def _bind_correlation_id(scope: Scope, correlation_id: Optional[str]) -> str:
+  """Store the request's correlation ID, generating one when none was sent."""
+  if not correlation_id:
+    # Opaque 128-bit token; cheaper than formatting a uuid4 and never parsed as a UUID.
+    correlation_id = os.urandom(16).hex()
+  # Request.state is backed by scope["state"], so handlers can read it as usual.
+  scope.setdefault("state", {})["correlation_id"] = correlation_id
+  return correlation_id
+
+
+def _with_correlation_header(message: Message, correlation_id: str) -> None:
+  """Set the correlation ID header on an ``http.response.start`` message.
+
+  Any correlation header already set by the endpoint or an inner middleware
+  is replaced, so the response carries exactly one.
+  """
+  headers = [(name, value) for name, value in message.get("headers", []) if name.lower() != _CORRELATION_HEADER]
+  headers.append((_CORRELATION_HEADER, correlation_id.encode("latin-1")))
+  message["headers"] = headers
+
+
+class LoggingMiddleware:
   """Middleware for logging all requests and responses with correlation IDs.
 
   This middleware:
@@ -26,49 +108,102 @@ class LoggingMiddleware(BaseHTTPMiddleware):
   - Tracks request duration
   - Logs response details (status code, duration)
   - Adds correlation ID to response headers
+
+  With ``log_requests=False`` only the correlation ID handling runs, so a
+  single instance covers both the full and the lightweight setup.
   """
 
-  async def dispatch(self, request: Request, call_next: Callable) -> Response:
-    """Process request and response with logging."""
-    # Generate or extract correlation ID
-    correlation_id = request.headers.get("X-Correlation-ID")
-    if not correlation_id:
-      correlation_id = str(uuid.uuid4())
+  def __init__(self, app: ASGIApp, log_requests: bool = True):
+    self.app = app
+    self.log_requests = log_requests
 
-    # Add correlation ID to request state for use in handlers
-    request.state.correlation_id = correlation_id
+  async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+    """Process request and response with logging."""
+    if scope["type"] != "http":
+      await self.app(scope, receive, send)
+      return
 
-    # Get client IP
-    client_host = request.client.host if request.client else "unknown"
+    correlation_id, user_agent = _scan_headers(scope)
+    correlation_id = _bind_correlation_id(scope, correlation_id)
+    token = correlation_id_var.set(correlation_id)
+    try:
+      if self.log_requests:
+        await self._call_with_logging(scope, receive, send, correlation_id, user_agent)
+      else:
+        await self.app(scope, receive, _correlation_send(send, correlation_id))
+    finally:
+      correlation_id_var.reset(token)
+
+  async def _call_with_logging(
+    self,
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    correlation_id: str,
+    user_agent: Optional[bytes],
+  ) -> None:
+    """Run the app, logging request start, completion and failure."""
+    method = scope["method"]
+    path = scope["path"]
+    client = scope.get("client")
+    client_host = client[0] if client else "unknown"
 
     # Start timing
     start_time = time.time()
 
-    # Log incoming request
-    logger.info(
-      f"Request started: {request.method} {request.url.path}",
-      extra={
-        "correlation_id": correlation_id,
-        "method": request.method,
-        "path": request.url.path,
-        "query_params": str(request.query_params),
-        "client_host": client_host,
-        "user_agent": request.headers.get("user-agent", "unknown"),
-      }
-    )
-
-    # Process request
+    # Log incoming request; skip building the extra payload when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Request started: %s %s",
+        method,
+        path,
+        extra={
+          "method": method,
+          "path": path,
+          "query_params": scope.get("query_string", b"").decode("latin-1"),
+          "client_host": client_host,
+          "user_agent": user_agent.decode("latin-1") if user_agent else "unknown",
+        }
+      )
+
+    async def send_wrapper(message: Message) -> None:
+      """Tag the response with the correlation ID and log completion."""
+      if message["type"] == "http.response.start":
+        _with_correlation_header(message, correlation_id)
+
+        # Log at response start so logging never delays body streaming
+        status_code = message["status"]
+        log_level = logging.INFO if status_code < 400 else logging.WARNING
+        if logger.isEnabledFor(log_level):
+          duration = time.time() - start_time
+          logger.log(
+            log_level,
+            "Request completed: %s %s - %s",
+            method,
+            path,
+            status_code,
+            extra={
+              "method": method,
+              "path": path,
+              "status_code": status_code,
+              "duration_ms": round(duration * 1000, 2),
+              "client_host": client_host,
+            }
+          )
+      await send(message)
+
     try:
-      response = await call_next(request)
+      await self.app(scope, receive, send_wrapper)
     except Exception as e:
       # Log exception
       duration = time.time() - start_time
       logger.error(
-        f"Request failed: {request.method} {request.url.path}",
+        "Request failed: %s %s",
+        method,
+        path,
         extra={
-          "correlation_id": correlation_id,
-          "method": request.method,
-          "path": request.url.path,
+          "method": method,
+          "path": path,
           "duration_ms": round(duration * 1000, 2),
           "error": str(e),
         },
@@ -76,62 +211,32 @@ class LoggingMiddleware(BaseHTTPMiddleware):
       )
       raise
 
-    # Calculate duration
-    duration = time.time() - start_time
-
-    # Add correlation ID to response headers
-    response.headers["X-Correlation-ID"] = correlation_id
-
-    # Log response
-    log_level = logging.INFO if response.status_code < 400 else logging.WARNING
-    logger.log(
-      log_level,
-      f"Request completed: {request.method} {request.url.path} - {response.status_code}",
-      extra={
-        "correlation_id": correlation_id,
-        "method": request.method,
-        "path": request.url.path,
-        "status_code": response.status_code,
-        "duration_ms": round(duration * 1000, 2),
-        "client_host": client_host,
-      }
-    )
-
-    return response
-
-
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
-  """Lightweight middleware that only adds correlation IDs.
-
-  Use this if you want correlation IDs without full request logging.
-  """
-
-  async def dispatch(self, request: Request, call_next: Callable) -> Response:
-    """Add correlation ID to request and response."""
-    # Generate or extract correlation ID
-    correlation_id = request.headers.get("X-Correlation-ID")
-    if not correlation_id:
-      correlation_id = str(uuid.uuid4())
-
-    # Add to request state
-    request.state.correlation_id = correlation_id
 
-    # Process request
-    response = await call_next(request)
+def _correlation_send(send: Send, correlation_id: str) -> Send:
+  """Wrap ``send`` so the response carries the correlation ID header."""
 
-    # Add to response headers
-    response.headers["X-Correlation-ID"] = correlation_id
+  async def send_wrapper(message: Message) -> None:
+    """Tag the response with the correlation ID."""
+    if message["type"] == "http.response.start":
+      _with_correlation_header(message, correlation_id)
+    await send(message)
 
-    return response
+  return send_wrapper
 
 
-def get_correlation_id(request: Request) -> str:
-  """Get correlation ID from request state.
+def get_correlation_id(request: Optional[Request] = None) -> str:
+  """Get the correlation ID for the current request.
 
   Args:
-    request: FastAPI request object
+    request: Optional FastAPI request object; its state takes precedence when
+      given. Without it, the ID bound by the middleware for the running
+      request context is returned.
 
   Returns:
     Correlation ID string
   """
-  return getattr(request.state, "correlation_id", "no-correlation-id")
+  if request is not None:
+    correlation_id = getattr(request.state, "correlation_id", None)
+    if correlation_id:
+      return correlation_id
+  return correlation_id_var.get()
@@ -8,7 +8,7 @@ we can enforce consistency before storing blobs in SQLite.
 from __future__ import annotations
 
 from base64 import b64encode
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -175,16 +175,58 @@ class GoogleResponse(_BaseModel):
 # Helper utilities
 # ---------------------------------------------------------------------------
 
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_plain_json(value: Any) -> bool:
+  """Return True if ``value`` only contains plain dicts, lists and JSON scalars."""
+  stack = [value]
+  while stack:
+    item = stack.pop()
+    item_type = type(item)
+    if item_type in _JSON_SCALAR_TYPES:
+      continue
+    if item_type is dict:
+      stack.extend(item.values())
+    elif item_type is list:
+      stack.extend(item)
+    else:
+      return False
+  return True
+
+
 def _sanitize_json_types(value: Any) -> Any:
-  """Recursively convert unsupported JSON types (bytes, sets, tuples) into safe values."""
-  if isinstance(value, Mapping):
-    return {key: _sanitize_json_types(val) for key, val in value.items()}
-  if isinstance(value, (list, tuple, set)):
-    return [_sanitize_json_types(item) for item in value]
-  if isinstance(value, (bytes, bytearray, memoryview)):
-    # Encode binary blobs so we retain data while keeping JSON-friendly output.
-    return b64encode(bytes(value)).decode("ascii")
-  return value
+  """Convert unsupported JSON types (bytes, sets, tuples) into safe values.
+
+  Walks the payload with an explicit stack, so deeply nested SDK payloads
+  can't hit the recursion limit, and returns plain-JSON input unchanged
+  without copying it.
+  """
+  if _is_plain_json(value):
+    return value
+
+  root: List[Any] = [None]
+  # (container to write into, key or index in it, value still to convert)
+  stack: List[Tuple[Union[List[Any], Dict[Any, Any]], Any, Any]] = [(root, 0, value)]
+  while stack:
+    parent, key, item = stack.pop()
+    item_type = type(item)
+    if item_type in _JSON_SCALAR_TYPES:
+      parent[key] = item
+    elif item_type is dict or isinstance(item, Mapping):
+      out: Dict[Any, Any] = dict.fromkeys(item)  # reserve keys in their original order
+      parent[key] = out
+      stack.extend((out, k, v) for k, v in item.items())
+    elif item_type is list or isinstance(item, (list, tuple, set)):
+      out_list: List[Any] = [None] * len(item)
+      parent[key] = out_list
+      stack.extend((out_list, i, v) for i, v in enumerate(item))
+    elif isinstance(item, (bytes, bytearray, memoryview)):
+      # Encode binary blobs so we retain data while keeping JSON-friendly output.
+      parent[key] = b64encode(bytes(item)).decode("ascii")
+    else:
+      parent[key] = item
+  return root[0]
 
 
 def _ensure_dict(payload: Any) -> Dict[str, Any]:
@@ -198,15 +240,21 @@ def _ensure_dict(payload: Any) -> Dict[str, Any]:
 
   Raises:
     TypeError: If the payload cannot be coerced into a dictionary.
+
+  Note:
+    Pydantic models (the OpenAI, Anthropic and Google SDK types) are dumped
+    with ``mode="json"``, which already yields JSON-native values, so only
+    plain dicts and ``to_dict()`` output go through ``_sanitize_json_types``.
+    Callers holding dicts with bytes, sets or tuples should pass the dict.
   """
   if payload is None:
     return {}
   if isinstance(payload, dict):
     return _sanitize_json_types(payload)
   if hasattr(payload, "model_dump"):
-    data = payload.model_dump()
+    data = payload.model_dump(mode="json")
     if isinstance(data, dict):
-      return _sanitize_json_types(data)
+      return data
   if hasattr(payload, "to_dict"):
     data = payload.to_dict()
     if isinstance(data, dict):
@@ -214,40 +262,38 @@ def _ensure_dict(payload: Any) -> Dict[str, Any]:
   raise TypeError(f"Cannot convert payload of type {type(payload)} to dict")
 
 
-def validate_openai_raw_response(payload: Any) -> Dict[str, Any]:
-  """Validate and normalize OpenAI Responses API payloads."""
-  data = _ensure_dict(payload)
+def _validate_raw_response(model_cls: type[_BaseModel], payload: Any, provider: str) -> Dict[str, Any]:
+  """Validate a raw provider payload against ``model_cls`` and dump it JSON-safe.
+
+  JSON text (str/bytes) is handed straight to pydantic-core's JSON parser,
+  skipping the Python dict round trip; everything else goes through
+  ``_ensure_dict`` first.
+  """
+  validate: Callable[[Any], _BaseModel]
+  if isinstance(payload, (str, bytes, bytearray)):
+    validate = model_cls.model_validate_json
+  else:
+    payload = _ensure_dict(payload)
+    validate = model_cls.model_validate
   try:
-    return OpenAIResponse.model_validate(data).model_dump(
-      exclude_none=True,
-      mode="json",
-    )
+    return validate(payload).model_dump(exclude_none=True, mode="json")
   except Exception as exc:
-    raise ValueError(f"Invalid OpenAI raw response: {exc}") from exc
+    raise ValueError(f"Invalid {provider} raw response: {exc}") from exc
+
+
+def validate_openai_raw_response(payload: Any) -> Dict[str, Any]:
+  """Validate and normalize OpenAI Responses API payloads (objects, dicts or JSON text)."""
+  return _validate_raw_response(OpenAIResponse, payload, "OpenAI")
 
 
 def validate_anthropic_raw_response(payload: Any) -> Dict[str, Any]:
-  """Validate and normalize Anthropic Claude payloads."""
-  data = _ensure_dict(payload)
-  try:
-    return AnthropicResponse.model_validate(data).model_dump(
-      exclude_none=True,
-      mode="json",
-    )
-  except Exception as exc:
-    raise ValueError(f"Invalid Anthropic raw response: {exc}") from exc
+  """Validate and normalize Anthropic Claude payloads (objects, dicts or JSON text)."""
+  return _validate_raw_response(AnthropicResponse, payload, "Anthropic")
 
 
 def validate_google_raw_response(payload: Any) -> Dict[str, Any]:
-  """Validate and normalize Google Gemini payloads."""
-  data = _ensure_dict(payload)
-  try:
-    return GoogleResponse.model_validate(data).model_dump(
-      exclude_none=True,
-      mode="json",
-    )
-  except Exception as exc:
-    raise ValueError(f"Invalid Google raw response: {exc}") from exc
+  """Validate and normalize Google Gemini payloads (objects, dicts or JSON text)."""
+  return _validate_raw_response(GoogleResponse, payload, "Google")
 
 
 __all__ = [
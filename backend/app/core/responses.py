@@ -0,0 +1,23 @@
+"""Response classes shared across the API."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+  """JSONResponse rendered by pydantic-core's Rust encoder instead of stdlib json.
+
+  Output matches ``JSONResponse`` (compact separators, UTF-8 text rather than
+  ASCII escapes), and pydantic-core also encodes datetimes, UUIDs and models
+  natively. Used as the app's default response class.
+
+  One deliberate difference: NaN and +/-Infinity are written as ``null``
+  (the same as pydantic's own JSON serialization) where ``JSONResponse``
+  raises ``ValueError`` and the request fails with a 500.
+  """
+
+  def render(self, content: Any) -> bytes:
+    """Encode ``content`` as JSON bytes."""
+    return to_json(content, inf_nan_mode="null")
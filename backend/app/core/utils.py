@@ -2,9 +2,31 @@
 
 import re
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, FrozenSet, Mapping, Optional
 from urllib.parse import urlparse
 
+from pydantic_core import from_json, to_json
+
+if TYPE_CHECKING:
+  from app.services.providers.provider_factory import ProviderFactory
+
+# Plain http(s) URL whose netloc needs no special handling (IPv6 brackets and
+# embedded tabs/newlines are left to urlparse).
+_HTTP_NETLOC_RE = re.compile(r"https?://([^/?#\[\]\t\r\n]*)(?:[/?#][^\t\r\n]*)?")
+
+# Fallback display-name formatting patterns, compiled once.
+_DATE_SUFFIX_RE = re.compile(r"-\d{7,8}$")
+_CLAUDE_RE = re.compile(r"^(claude)-(sonnet|opus|haiku)-(\d+)[-\.](\d+)(?:\.\d+)?$")
+_TRAILING_VERSION_RE = re.compile(r"(v\d+)\.\d+$", re.IGNORECASE)
+
+# Web capture / network log models that aren't in the provider registry.
+_WEB_CAPTURE_DISPLAY_NAMES = {
+  'ChatGPT (Free)': 'ChatGPT (Free)',
+  'chatgpt-free': 'ChatGPT (Free)',
+  'ChatGPT': 'ChatGPT (Free)',
+}
+
 
 def extract_domain(url: str) -> Optional[str]:
   """Extract domain from URL.
@@ -22,8 +44,9 @@ def extract_domain(url: str) -> Optional[str]:
     'subdomain.example.com'
   """
   try:
-    parsed = urlparse(url)
-    domain = parsed.netloc
+    # Fast path for ordinary http(s) URLs; urlparse handles everything else.
+    match = _HTTP_NETLOC_RE.fullmatch(url) if url else None
+    domain = match.group(1) if match else urlparse(url).netloc
 
     # Remove www. prefix if present
     if domain.startswith("www."):
@@ -34,6 +57,29 @@ def extract_domain(url: str) -> Optional[str]:
     return None
 
 
+_PROVIDER_FACTORY: Optional[type["ProviderFactory"]] = None
+_KNOWN_MODELS: Optional[FrozenSet[str]] = None
+
+
+def _provider_factory() -> type["ProviderFactory"]:
+  """Return the ProviderFactory class, importing it on first use only."""
+  global _PROVIDER_FACTORY
+  if _PROVIDER_FACTORY is None:
+    # Import here to avoid circular dependency; only cache once it succeeds.
+    from app.services.providers.provider_factory import ProviderFactory
+    _PROVIDER_FACTORY = ProviderFactory
+  return _PROVIDER_FACTORY
+
+
+def _known_models() -> FrozenSet[str]:
+  """Return canonical model IDs from ProviderFactory, built once."""
+  global _KNOWN_MODELS
+  if _KNOWN_MODELS is None:
+    _KNOWN_MODELS = frozenset(_provider_factory().MODEL_PROVIDER_MAP)
+  return _KNOWN_MODELS
+
+
+@lru_cache(maxsize=512)
 def normalize_model_name(model_name: str) -> str:
   """Normalize model name for consistent storage.
 
@@ -56,11 +102,9 @@ def normalize_model_name(model_name: str) -> str:
     >>> normalize_model_name("claude-sonnet-4-5-20250929")
     'claude-sonnet-4-5-20250929'  # Preserved as-is
   """
-  # Import here to avoid circular dependency
   try:
-    from app.services.providers.provider_factory import ProviderFactory
     # If this model is in the canonical MODEL_PROVIDER_MAP, return as-is
-    if model_name in ProviderFactory.MODEL_PROVIDER_MAP:
+    if model_name in _known_models():
       return model_name
   except ImportError:
     # If import fails, proceed with normalization logic
@@ -93,7 +137,7 @@ def calculate_average_rank(citations: list[Any]) -> Optional[float]:
   """Calculate average rank of citations.
 
   Args:
-    citations: List of citation objects with rank attribute
+    citations: List of citation objects with a rank attribute, or dicts with a "rank" key
 
   Returns:
     Average rank or None if no ranked citations
@@ -103,15 +147,18 @@ def calculate_average_rank(citations: list[Any]) -> Optional[float]:
     >>> calculate_average_rank(citations)
     3.0
   """
-  if not citations:
-    return None
-  rank_values = [getattr(c, 'rank', None) for c in citations]
-  ranks: list[float] = [float(r) for r in rank_values if isinstance(r, (int, float))]
-  if not ranks:
-    return None
-  return sum(ranks) / len(ranks)
-
-
+  # Single pass with running totals; no intermediate lists.
+  total = 0.0
+  count = 0
+  for citation in citations or ():
+    rank = citation.get('rank') if isinstance(citation, Mapping) else getattr(citation, 'rank', None)
+    if isinstance(rank, (int, float)):
+      total += rank
+      count += 1
+  return total / count if count else None
+
+
+@lru_cache(maxsize=512)
 def get_model_display_name(model: str) -> str:
   """Get formatted display name for a model.
 
@@ -139,30 +186,26 @@ def get_model_display_name(model: str) -> str:
 
   # Try to get from centralized registry first
   try:
-    from app.services.providers.provider_factory import ProviderFactory
-    display_name = ProviderFactory.get_display_name(model)
+    provider_factory = _provider_factory()
+    display_name = provider_factory.get_display_name(model)
     if not display_name and model.startswith("claude-"):
-      display_name = ProviderFactory.get_display_name(model.replace(".", "-"))
+      display_name = provider_factory.get_display_name(model.replace(".", "-"))
     if display_name:
       return display_name
   except ImportError:
     pass
 
   # Special cases for web capture / network log models not in registry
-  web_capture_models = {
-    'ChatGPT (Free)': 'ChatGPT (Free)',
-    'chatgpt-free': 'ChatGPT (Free)',
-    'ChatGPT': 'ChatGPT (Free)',
-  }
-  if model in web_capture_models:
-    return web_capture_models[model]
+  web_capture_name = _WEB_CAPTURE_DISPLAY_NAMES.get(model)
+  if web_capture_name:
+    return web_capture_name
 
   # Fallback: Format unknown model IDs nicely.
   # Remove date suffixes (e.g., -20250929 or -0250929).
-  core = re.sub(r'-\d{7,8}$', '', model)
+  core = _DATE_SUFFIX_RE.sub('', model)
 
   # Claude variants can appear with dotted minor versions (e.g., 4.1) or patch versions (e.g., 4-5.2).
-  m = re.match(r"^(claude)-(sonnet|opus|haiku)-(\d+)[-\.](\d+)(?:\.\d+)?$", core)
+  m = _CLAUDE_RE.match(core)
   if m:
     family = m.group(2).capitalize()
     return f"Claude {family} {m.group(3)}.{m.group(4)}"
@@ -174,7 +217,7 @@ def get_model_display_name(model: str) -> str:
     return f"Gemini-{core[7:]}"
 
   # Generic models sometimes include trailing patch-like versions (e.g., v2.5).
-  core = re.sub(r"(v\d+)\.\d+$", r"\1", core, flags=re.IGNORECASE)
+  core = _TRAILING_VERSION_RE.sub(r"\1", core)
 
   # Generic: hyphens to spaces, title-case words, preserve dots.
   return ' '.join(word.capitalize() for word in core.split('-'))
@@ -196,7 +239,35 @@ def format_pub_date(pub_date: str) -> str:
   if not pub_date:
     return ""
   try:
-    dt = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
+    # Python 3.11+ parses a trailing "Z" natively, so no string rewrite is needed.
+    dt = datetime.fromisoformat(pub_date)
     return dt.strftime("%a, %b %d, %Y %H:%M UTC")
   except Exception:
     return pub_date
+
+
+def json_serializer(value: Any) -> str:
+  """Encode a JSON column value using pydantic-core's Rust encoder.
+
+  Used as the SQLAlchemy engine ``json_serializer`` so large payloads such as
+  raw provider responses are not encoded through the stdlib ``json`` module.
+
+  Args:
+    value: JSON-compatible Python value
+
+  Returns:
+    JSON text
+  """
+  return to_json(value).decode("utf-8")
+
+
+def json_deserializer(text: str) -> Any:
+  """Decode a JSON column value using pydantic-core's Rust parser.
+
+  Args:
+    text: JSON text read from the database
+
+  Returns:
+    Decoded Python value
+  """
+  return from_json(text)
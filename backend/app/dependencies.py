@@ -7,9 +7,13 @@ proper resource management and testability.
 Dependency Chain:
 1. get_db() -> SQLAlchemy Session
 2. get_interaction_repository() -> InteractionRepository (needs db)
-3. get_interaction_service() -> InteractionService (needs repository)
-4. get_provider_service() -> ProviderService (needs interaction_service)
-5. get_export_service() -> ExportService (needs interaction_service)
+3. get_interaction_service() -> InteractionService (needs db)
+4. get_provider_service() -> ProviderService (needs db)
+5. get_export_service() -> ExportService (needs db)
+
+The service dependencies build their repository/service stack inline from
+the session rather than chaining through each other, so FastAPI resolves
+one sub-dependency per request instead of a three-level tree.
 
 The dependencies automatically handle:
 - Database connection lifecycle (open/close)
@@ -24,13 +28,16 @@ Example:
         return interaction_service.get_recent_interactions()
 """
 
-from typing import Generator
+from typing import Any, Dict, Generator
 
 from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.config import settings
+from app.core.utils import json_deserializer, json_serializer
 from app.repositories.interaction_repository import InteractionRepository
 from app.services.batch_service import BatchService
 from app.services.citation_tagging_service import CitationTaggingService
@@ -38,12 +45,52 @@ from app.services.export_service import ExportService
 from app.services.interaction_service import InteractionService
 from app.services.provider_service import ProviderService
 
+
+def _is_memory_sqlite(url: URL) -> bool:
+  """Return True for in-memory SQLite URLs."""
+  return url.database in (None, "", ":memory:")
+
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+  """Return create_engine pool/connect options suited to the database backend.
+
+  In-memory SQLite shares one connection (StaticPool); file-backed SQLite
+  waits on locks instead of failing fast; server databases get a sized,
+  pre-pinged pool from settings.
+
+  The in-memory configuration is single-request only. Session-using routes
+  run in the threadpool, and every worker would share the one sqlite3
+  connection with no serialization, interleaving their transactions. Use
+  it for tests and throwaway local runs, not for serving concurrent traffic.
+  """
+  url = make_url(database_url)
+  if url.get_backend_name() == "sqlite":
+    if _is_memory_sqlite(url):
+      # One shared connection, or each checkout would see its own empty database
+      return {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+    return {"connect_args": {"check_same_thread": False, "timeout": 30}}
+  return {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_pre_ping": True,
+  }
+
+
+def _create_engine(database_url: str) -> Engine:
+  """Create the application engine with backend-specific pool settings."""
+  return create_engine(
+    database_url,
+    echo=settings.DEBUG,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+    **_engine_options(database_url),
+  )
+
+
 # Create database engine
-engine = create_engine(
-  settings.DATABASE_URL,
-  connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-  echo=settings.DEBUG,
-)
+engine = _create_engine(settings.DATABASE_URL)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -82,46 +129,45 @@ def get_interaction_repository(db: Session = Depends(get_db)) -> InteractionRepo
   return InteractionRepository(db)
 
 
-def get_interaction_service(
-  repository: InteractionRepository = Depends(get_interaction_repository)
-) -> InteractionService:
-  """Get InteractionService instance with repository.
+def _build_interaction_service(db: Session) -> InteractionService:
+  """Build an InteractionService over a repository bound to ``db``."""
+  return InteractionService(InteractionRepository(db), citation_tagger=citation_tagger_instance)
+
+
+def get_interaction_service(db: Session = Depends(get_db)) -> InteractionService:
+  """Get InteractionService instance with a session-bound repository.
 
   Args:
-    repository: InteractionRepository from get_interaction_repository dependency
+    db: Database session from get_db dependency
 
   Returns:
     InteractionService instance
   """
-  return InteractionService(repository, citation_tagger=citation_tagger_instance)
+  return _build_interaction_service(db)
 
 
-def get_provider_service(
-  interaction_service: InteractionService = Depends(get_interaction_service)
-) -> ProviderService:
-  """Get ProviderService instance with interaction service.
+def get_provider_service(db: Session = Depends(get_db)) -> ProviderService:
+  """Get ProviderService instance with a session-bound interaction service.
 
   Args:
-    interaction_service: InteractionService from get_interaction_service dependency
+    db: Database session from get_db dependency
 
   Returns:
     ProviderService instance
   """
-  return ProviderService(interaction_service)
+  return ProviderService(_build_interaction_service(db))
 
 
-def get_export_service(
-  interaction_service: InteractionService = Depends(get_interaction_service)
-) -> ExportService:
-  """Get ExportService instance with interaction service.
+def get_export_service(db: Session = Depends(get_db)) -> ExportService:
+  """Get ExportService instance with a session-bound interaction service.
 
   Args:
-    interaction_service: InteractionService from get_interaction_service dependency
+    db: Database session from get_db dependency
 
   Returns:
     ExportService instance
   """
-  return ExportService(interaction_service)
+  return ExportService(_build_interaction_service(db))
 
 
 def get_batch_service() -> BatchService:
@@ -25,31 +25,25 @@ Environment Configuration:
 """
 
 import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from pydantic_core import to_json
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.v1.endpoints import interactions, providers
 from app.config import settings
-from app.core.exceptions import APIException, DatabaseError
-from app.core.middleware import LoggingMiddleware, get_correlation_id
+from app.core.exceptions import APIException, DatabaseError, InternalServerError
+from app.core.middleware import CorrelationIdFilter, LoggingMiddleware, get_correlation_id
+from app.core.responses import FastJSONResponse
 from app.dependencies import engine
 
-
-class CorrelationIdFilter(logging.Filter):
-  """Add default correlation_id to all log records."""
-
-  def filter(self, record):
-    """Add correlation_id to log record if not present."""
-    if not hasattr(record, 'correlation_id'):
-      record.correlation_id = 'no-correlation-id'
-    return True
-
-
 # Configure logging with more detailed format
 logging.basicConfig(
   level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
@@ -69,25 +63,51 @@ app = FastAPI(
   version="1.0.0",
   docs_url="/docs",
   redoc_url="/redoc",
+  default_response_class=FastJSONResponse,
 )
 
 # CORS middleware configuration for future React frontend
 app.add_middleware(
   CORSMiddleware,
-  allow_origins=settings.CORS_ORIGINS,
+  allow_origins=settings.cors_origins_set,
   allow_credentials=True,
   allow_methods=["*"],
   allow_headers=["*"],
 )
 
 # Add logging middleware for request/response tracking and correlation IDs
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(LoggingMiddleware, log_requests=settings.ENABLE_REQUEST_LOGGING)
 
 # Include API routers
 app.include_router(interactions.router, prefix="/api/v1")
 app.include_router(providers.router, prefix="/api/v1")
 
 
+# FastAPI caches the OpenAPI dict but re-encodes it on every /openapi.json hit;
+# encode it once (on first request, after all routes exist) and serve the bytes.
+# Mirrors FastAPI's stock route, including adding the proxy root_path to servers.
+_openapi_bytes: Optional[bytes] = None
+_openapi_server_urls = {url for url in (server.get("url") for server in app.servers) if url}
+
+
+async def openapi_json(request: Request) -> Response:
+  """Serve the pre-encoded OpenAPI schema."""
+  global _openapi_bytes
+  root_path = request.scope.get("root_path", "").rstrip("/")
+  if root_path not in _openapi_server_urls:
+    if root_path and app.root_path_in_servers:
+      app.servers.insert(0, {"url": root_path})
+      _openapi_server_urls.add(root_path)
+  if _openapi_bytes is None:
+    _openapi_bytes = to_json(app.openapi())
+  return Response(content=_openapi_bytes, media_type="application/json")
+
+
+if app.openapi_url:
+  app.router.routes = [route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url]
+  app.add_route(app.openapi_url, openapi_json, include_in_schema=False)
+
+
 @app.get("/")
 async def root():
   """Root endpoint - API information."""
@@ -99,32 +119,61 @@ async def root():
   }
 
 
-@app.get("/health")
-async def health_check():
-  """Health check endpoint - verifies API and database connectivity."""
+# Probe results are reused briefly so frequent liveness/readiness checks
+# don't each take a pooled connection.
+HEALTH_CACHE_TTL_SECONDS = 2.0
+_health_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None
+_health_lock = threading.Lock()
+
+
+def _probe_database() -> Tuple[int, Dict[str, Any]]:
+  """Run the database connectivity check and return (status code, body)."""
   try:
     # Test database connectivity
     with engine.connect() as conn:
       conn.execute(text("SELECT 1"))
 
-    return {
+    return 200, {
       "status": "healthy",
       "version": "1.0.0",
       "database": "connected",
     }
   except Exception as e:
-    return JSONResponse(
-      status_code=503,
-      content={
-        "status": "unhealthy",
-        "database": "error",
-        "error": str(e),
-      },
-    )
+    return 503, {
+      "status": "unhealthy",
+      "database": "error",
+      "error": str(e),
+    }
+
+
+# Plain def: the connectivity probe uses the sync engine, so FastAPI runs it
+# in the threadpool instead of blocking the event loop.
+@app.get("/health")
+def health_check():
+  """Health check endpoint - verifies API and database connectivity."""
+  global _health_cache
+  cached = _health_cache
+  if cached is None or time.monotonic() - cached[0] >= HEALTH_CACHE_TTL_SECONDS:
+    with _health_lock:
+      # Another worker thread may have refreshed it while we waited
+      cached = _health_cache
+      if cached is None or time.monotonic() - cached[0] >= HEALTH_CACHE_TTL_SECONDS:
+        cached = (time.monotonic(), *_probe_database())
+        _health_cache = cached
+
+  _, status_code, body = cached
+  if status_code == 200:
+    return body
+  return FastJSONResponse(status_code=status_code, content=body)
 
 
 # Exception handlers for consistent error responses
 
+def _api_error_response(exc: APIException) -> Response:
+  """Build the JSON error response for an APIException."""
+  return Response(content=exc.to_json(), status_code=exc.status_code, media_type="application/json")
+
+
 @app.exception_handler(APIException)
 async def api_exception_handler(request: Request, exc: APIException):
   """Handle custom API exceptions with error codes.
@@ -133,7 +182,9 @@ async def api_exception_handler(request: Request, exc: APIException):
   a consistent JSON response with error code, message, and details.
   """
   logger.error(
-    f"API Exception: {exc.error_code} - {exc.message}",
+    "API Exception: %s - %s",
+    exc.error_code,
+    exc.message,
     extra={
       "correlation_id": get_correlation_id(request),
       "error_code": exc.error_code,
@@ -144,10 +195,7 @@ async def api_exception_handler(request: Request, exc: APIException):
     }
   )
 
-  return JSONResponse(
-    status_code=exc.status_code,
-    content=exc.to_dict(),
-  )
+  return _api_error_response(exc)
 
 
 @app.exception_handler(RequestValidationError)
@@ -158,17 +206,18 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
   with field-level error details.
   """
   # Extract field errors
-  errors = []
-  for error in exc.errors():
-    field_path = " -> ".join(str(loc) for loc in error["loc"])
-    errors.append({
-      "field": field_path,
+  errors = [
+    {
+      "field": " -> ".join(map(str, error["loc"])),
       "message": error["msg"],
       "type": error["type"],
-    })
+    }
+    for error in exc.errors()
+  ]
 
   logger.warning(
-    f"Validation error on {request.url.path}",
+    "Validation error on %s",
+    request.url.path,
     extra={
       "correlation_id": get_correlation_id(request),
       "path": request.url.path,
@@ -177,7 +226,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     }
   )
 
-  return JSONResponse(
+  return FastJSONResponse(
     status_code=422,
     content={
       "error": {
@@ -198,26 +247,26 @@ async def database_exception_handler(request: Request, exc: SQLAlchemyError):
   Wraps SQLAlchemy errors in our custom DatabaseError format.
   Hides sensitive database details in production.
   """
+  error_type = type(exc).__name__
   logger.error(
-    f"Database error on {request.url.path}: {str(exc)}",
+    "Database error on %s: %s",
+    request.url.path,
+    exc,
     extra={
       "correlation_id": get_correlation_id(request),
       "path": request.url.path,
       "method": request.method,
-      "error_type": type(exc).__name__,
+      "error_type": error_type,
     },
     exc_info=True,
   )
 
   db_error = DatabaseError(
     message="A database error occurred",
-    details={"error_type": type(exc).__name__} if settings.DEBUG else None,
+    details={"error_type": error_type} if settings.DEBUG else None,
   )
 
-  return JSONResponse(
-    status_code=db_error.status_code,
-    content=db_error.to_dict(),
-  )
+  return _api_error_response(db_error)
 
 
 @app.exception_handler(Exception)
@@ -227,23 +276,22 @@ async def global_exception_handler(request: Request, exc: Exception):
   This is the last line of defense - catches any unexpected errors
   that aren't handled by more specific handlers.
   """
+  error_type = type(exc).__name__
   logger.exception(
-    f"Unhandled exception on {request.url.path}",
+    "Unhandled exception on %s",
+    request.url.path,
     extra={
       "correlation_id": get_correlation_id(request),
       "path": request.url.path,
       "method": request.method,
-      "error_type": type(exc).__name__,
+      "error_type": error_type,
     },
   )
 
-  from app.core.exceptions import InternalServerError
   error = InternalServerError(
     message="An unexpected error occurred",
-    details={"error_type": type(exc).__name__, "error": str(exc)} if settings.DEBUG else None,
+    # str(exc) can be large (full SQL, reprs); only build it when it is returned
+    details={"error_type": error_type, "error": str(exc)} if settings.DEBUG else None,
   )
 
-  return JSONResponse(
-    status_code=error.status_code,
-    content=error.to_dict(),
-  )
+  return _api_error_response(error)
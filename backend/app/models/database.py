@@ -17,8 +17,13 @@ from sqlalchemy import (
   String,
   Text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+# Stored as binary JSONB on PostgreSQL (no text reparse for JSON operators,
+# GIN-indexable); other backends such as SQLite keep the generic JSON type.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
   """Base class for SQLAlchemy ORM models."""
@@ -54,7 +59,7 @@ class InteractionModel(Base):
   created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
   updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
   deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
-  metadata_json: Mapped[Optional[Any]] = mapped_column(JSON)
+  metadata_json: Mapped[Optional[Any]] = mapped_column(JSONType)
 
   __table_args__ = (
     Index("ix_interactions_created_at", "created_at"),
@@ -84,7 +89,7 @@ class Response(Base):
   response_text: Mapped[Optional[str]] = mapped_column(Text)
   response_time_ms: Mapped[Optional[int]] = mapped_column(Integer)
   created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-  raw_response_json: Mapped[Optional[Any]] = mapped_column(JSON)
+  raw_response_json: Mapped[Optional[Any]] = mapped_column(JSONType)
   data_source: Mapped[str] = mapped_column(String(20), default="api")
   extra_links_count: Mapped[int] = mapped_column(Integer, default=0)
 
@@ -100,6 +105,9 @@ class Response(Base):
 
   __table_args__ = (
     Index("ix_responses_created_at", "created_at"),
+    Index("ix_responses_interaction_id", "interaction_id"),
+    # Serves the recent-interactions list filtered by data source, newest first
+    Index("ix_responses_data_source_created_at", "data_source", "created_at"),
   )
 
   interaction: Mapped["InteractionModel"] = relationship("InteractionModel", back_populates="responses")
@@ -136,8 +144,8 @@ class SearchQuery(Base):
   created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
   order_index: Mapped[int] = mapped_column(Integer, default=0)
 
-  internal_ranking_scores: Mapped[Optional[Any]] = mapped_column(JSON)
-  query_reformulations: Mapped[Optional[Any]] = mapped_column(JSON)
+  internal_ranking_scores: Mapped[Optional[Any]] = mapped_column(JSONType)
+  query_reformulations: Mapped[Optional[Any]] = mapped_column(JSONType)
 
   __table_args__ = (
     Index("ix_search_queries_response_id", "response_id"),
@@ -160,7 +168,7 @@ class QuerySource(Base):
   rank: Mapped[Optional[int]] = mapped_column(Integer)
   pub_date: Mapped[Optional[str]] = mapped_column(String(50))
   internal_score: Mapped[Optional[float]] = mapped_column(Float)
-  metadata_json: Mapped[Optional[Any]] = mapped_column(JSON)
+  metadata_json: Mapped[Optional[Any]] = mapped_column(JSONType)
 
   search_query: Mapped["SearchQuery"] = relationship("SearchQuery", back_populates="sources")
 
@@ -183,7 +191,7 @@ class ResponseSource(Base):
   pub_date: Mapped[Optional[str]] = mapped_column(String(50))
   search_description: Mapped[Optional[str]] = mapped_column(Text)
   internal_score: Mapped[Optional[float]] = mapped_column(Float)
-  metadata_json: Mapped[Optional[Any]] = mapped_column(JSON)
+  metadata_json: Mapped[Optional[Any]] = mapped_column(JSONType)
 
   response: Mapped["Response"] = relationship("Response", back_populates="response_sources")
 
@@ -211,10 +219,10 @@ class SourceUsed(Base):
 
   snippet_cited: Mapped[Optional[str]] = mapped_column(Text)
   citation_confidence: Mapped[Optional[float]] = mapped_column(Float)
-  metadata_json: Mapped[Optional[Any]] = mapped_column(JSON)
-  function_tags: Mapped[Any] = mapped_column(JSON, default=list, nullable=False)
-  stance_tags: Mapped[Any] = mapped_column(JSON, default=list, nullable=False)
-  provenance_tags: Mapped[Any] = mapped_column(JSON, default=list, nullable=False)
+  metadata_json: Mapped[Optional[Any]] = mapped_column(JSONType)
+  function_tags: Mapped[Any] = mapped_column(JSONType, default=list, nullable=False)
+  stance_tags: Mapped[Any] = mapped_column(JSONType, default=list, nullable=False)
+  provenance_tags: Mapped[Any] = mapped_column(JSONType, default=list, nullable=False)
   influence_summary: Mapped[Optional[str]] = mapped_column(Text)
   mentions: Mapped[List["SourceUsedMention"]] = relationship(
     "SourceUsedMention",
@@ -257,11 +265,11 @@ class SourceUsedMention(Base):
   start_index: Mapped[Optional[int]] = mapped_column(Integer)
   end_index: Mapped[Optional[int]] = mapped_column(Integer)
   snippet_cited: Mapped[Optional[str]] = mapped_column(Text)
-  metadata_json: Mapped[Optional[Any]] = mapped_column(JSON)
+  metadata_json: Mapped[Optional[Any]] = mapped_column(JSONType)
 
-  function_tags: Mapped[Any] = mapped_column(JSON, default=list, nullable=False)
-  stance_tags: Mapped[Any] = mapped_column(JSON, default=list, nullable=False)
-  provenance_tags: Mapped[Any] = mapped_column(JSON, default=list, nullable=False)
+  function_tags: Mapped[Any] = mapped_column(JSONType, default=list, nullable=False)
+  stance_tags: Mapped[Any] = mapped_column(JSONType, default=list, nullable=False)
+  provenance_tags: Mapped[Any] = mapped_column(JSONType, default=list, nullable=False)
   influence_summary: Mapped[Optional[str]] = mapped_column(Text)
 
   created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
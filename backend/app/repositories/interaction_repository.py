@@ -7,11 +7,12 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Any, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, defer, joinedload
+from sqlalchemy.orm import InstrumentedAttribute, Session, defer, joinedload, raiseload, selectinload
 
 from app.models.database import (
+  Base,
   InteractionModel,
   Provider,
   QuerySource,
@@ -118,6 +119,23 @@ def _extract_snippets_from_citations(text: str) -> dict:
   return dict(snippets_by_number)
 
 
+# Eager-load graph for a response. Many-to-one parents are joined in; each
+# collection is fetched with its own batched IN query so sibling collections
+# never multiply into one cartesian row set and LIMIT applies to responses.
+# Every other relationship on the graph raises instead of lazy loading, so a
+# new attribute access can't silently turn into N+1 queries; sql_only lets
+# back-references already in the identity map resolve without raising.
+_RESPONSE_LOAD_OPTIONS = (
+  joinedload(Response.interaction).joinedload(InteractionModel.provider).raiseload("*", sql_only=True),
+  joinedload(Response.interaction).raiseload("*", sql_only=True),
+  selectinload(Response.search_queries).selectinload(SearchQuery.sources).raiseload("*", sql_only=True),
+  selectinload(Response.search_queries).raiseload("*", sql_only=True),
+  selectinload(Response.sources_used).selectinload(SourceUsed.mentions).raiseload("*", sql_only=True),
+  selectinload(Response.sources_used).raiseload("*", sql_only=True),
+  selectinload(Response.response_sources).raiseload("*", sql_only=True),
+  raiseload("*", sql_only=True),
+)
+
 # Provider display name mapping
 PROVIDER_DISPLAY_NAMES = {
   'openai': 'OpenAI',
@@ -253,59 +271,61 @@ class InteractionRepository:
       self.db.add(response)
       self.db.flush()
 
-      # Create search queries and sources
-      for i, query_data in enumerate(search_queries):
-        search_query = SearchQuery(
-          response_id=response.id,
-          search_query=query_data.get("query", ""),
-          order_index=query_data.get("order_index", 0),
-          internal_ranking_scores=query_data.get("internal_ranking_scores"),
-          query_reformulations=query_data.get("query_reformulations"),
-        )
-        self.db.add(search_query)
-        self.db.flush()
+      # Child rows are written with one bulk INSERT per table (executemany /
+      # insertmanyvalues) rather than through the unit of work; ids needed by
+      # child rows or citation matching come back via RETURNING in row order.
 
-        # Create sources for this query
+      # Create search queries and sources
+      search_query_rows = [
+        {
+          "response_id": response.id,
+          "search_query": query_data.get("query", ""),
+          "order_index": query_data.get("order_index", 0),
+          "internal_ranking_scores": query_data.get("internal_ranking_scores"),
+          "query_reformulations": query_data.get("query_reformulations"),
+        }
+        for query_data in search_queries
+      ]
+      search_query_ids = self._insert_returning_ids(SearchQuery, SearchQuery.id, search_query_rows)
+
+      query_source_rows: List[dict] = []
+      for search_query_id, query_data in zip(search_query_ids, search_queries):
         for source_data in query_data.get("sources", []):
-          source = QuerySource(
-            search_query_id=search_query.id,
-            url=source_data.get("url", ""),
-            title=source_data.get("title"),
-            domain=source_data.get("domain"),
-            rank=source_data.get("rank"),
-            pub_date=source_data.get("pub_date"),
-            internal_score=source_data.get("internal_score"),
-            metadata_json=source_data.get("metadata"),
-          )
-          self.db.add(source)
-          self.db.flush()
-          register_source(query_source_lookup, source.url or "", source.rank, source.id)
+          query_source_rows.append({
+            "search_query_id": search_query_id,
+            "url": source_data.get("url", ""),
+            "title": source_data.get("title"),
+            "domain": source_data.get("domain"),
+            "rank": source_data.get("rank"),
+            "pub_date": source_data.get("pub_date"),
+            "internal_score": source_data.get("internal_score"),
+            "metadata_json": source_data.get("metadata"),
+          })
 
       # Create top-level sources (for web capture mode)
-      if sources:
-        for source_data in sources:
-          response_source = ResponseSource(
-            response_id=response.id,
-            url=source_data.get("url", ""),
-            title=source_data.get("title"),
-            domain=source_data.get("domain"),
-            rank=source_data.get("rank"),
-            pub_date=source_data.get("pub_date"),
-            search_description=(
-              source_data.get("search_description")
-              or source_data.get("snippet_text")
-            ),
-            internal_score=source_data.get("internal_score"),
-            metadata_json=source_data.get("metadata"),
-          )
-          self.db.add(response_source)
-          self.db.flush()
-          register_source(
-            response_source_lookup,
-            response_source.url or "",
-            response_source.rank,
-            response_source.id,
-          )
+      response_source_rows: List[dict] = []
+      for source_data in sources or []:
+        response_source_rows.append({
+          "response_id": response.id,
+          "url": source_data.get("url", ""),
+          "title": source_data.get("title"),
+          "domain": source_data.get("domain"),
+          "rank": source_data.get("rank"),
+          "pub_date": source_data.get("pub_date"),
+          "search_description": (
+            source_data.get("search_description")
+            or source_data.get("snippet_text")
+          ),
+          "internal_score": source_data.get("internal_score"),
+          "metadata_json": source_data.get("metadata"),
+        })
+
+      query_source_ids = self._insert_returning_ids(QuerySource, QuerySource.id, query_source_rows)
+      for row, source_id in zip(query_source_rows, query_source_ids):
+        register_source(query_source_lookup, row["url"] or "", row["rank"], source_id)
+      response_source_ids = self._insert_returning_ids(ResponseSource, ResponseSource.id, response_source_rows)
+      for row, source_id in zip(response_source_rows, response_source_ids):
+        register_source(response_source_lookup, row["url"] or "", row["rank"], source_id)
 
       def _clean_snippet(value: Optional[str]) -> Optional[str]:
         if isinstance(value, str):
@@ -358,7 +378,11 @@ class InteractionRepository:
             snippet_mapping[citation_num] = snippets_by_number.get(citation_num, [])
 
       # Create sources used (citations)
-      source_used_lookup: dict[tuple[str, Optional[int]], SourceUsed] = {}
+      # Citations are collected as rows and inserted after the loop, so
+      # mentions refer to their citation by its position in source_used_rows.
+      source_used_rows: List[dict] = []
+      source_used_lookup: dict[tuple[str, Optional[int]], int] = {}
+      mention_rows: List[Tuple[int, dict]] = []
       mention_counts: dict[int, int] = {}
       mention_seen: dict[int, set[str]] = {}
       for citation_data in sources_used:
@@ -366,7 +390,7 @@ class InteractionRepository:
         url_norm = _normalize_url(url)
         key = (url_norm, citation_data.get("rank"))
 
-        existing_source = source_used_lookup.get(key)
+        source_used_index = source_used_lookup.get(key)
 
         matched_query_source = match_source(
           query_source_lookup,
@@ -402,53 +426,58 @@ class InteractionRepository:
           # For API mode: do not persist snippet_cited (indices can be provider-specific and may not align).
           snippet_value = None
 
-        if existing_source is None:
-          source_used = SourceUsed(
-            response_id=response.id,
-            query_source_id=matched_query_source,
-            response_source_id=matched_response_source,
-            url=url,
-            title=citation_data.get("title"),
-            rank=citation_data.get("rank"),
-            snippet_cited=snippet_value,
-            citation_confidence=citation_data.get("citation_confidence"),
-            metadata_json=metadata,
-            function_tags=citation_data.get("function_tags") or [],
-            stance_tags=citation_data.get("stance_tags") or [],
-            provenance_tags=citation_data.get("provenance_tags") or [],
-            influence_summary=citation_data.get("influence_summary"),
-          )
-          self.db.add(source_used)
-          self.db.flush()
-          source_used_lookup[key] = source_used
+        if source_used_index is None:
+          source_used_index = len(source_used_rows)
+          source_used_rows.append({
+            "response_id": response.id,
+            "query_source_id": matched_query_source,
+            "response_source_id": matched_response_source,
+            "url": url,
+            "title": citation_data.get("title"),
+            "rank": citation_data.get("rank"),
+            "snippet_cited": snippet_value,
+            "citation_confidence": citation_data.get("citation_confidence"),
+            "metadata_json": metadata,
+            "function_tags": citation_data.get("function_tags") or [],
+            "stance_tags": citation_data.get("stance_tags") or [],
+            "provenance_tags": citation_data.get("provenance_tags") or [],
+            "influence_summary": citation_data.get("influence_summary"),
+          })
+          source_used_lookup[key] = source_used_index
         else:
-          source_used = existing_source
-          if source_used.snippet_cited is None and snippet_value is not None:
-            source_used.snippet_cited = snippet_value
+          source_used = source_used_rows[source_used_index]
+          if source_used["snippet_cited"] is None and snippet_value is not None:
+            source_used["snippet_cited"] = snippet_value
 
         # Persist per-mention snippets for web/network_log responses.
         if response.data_source in ("web", "network_log") and mention_snippets:
-          mention_idx = mention_counts.get(source_used.id, 0)
-          seen = mention_seen.setdefault(source_used.id, set())
+          mention_idx = mention_counts.get(source_used_index, 0)
+          seen = mention_seen.setdefault(source_used_index, set())
           for snippet in mention_snippets:
             clean_snippet = _clean_snippet(snippet)
             if not clean_snippet:
               continue
             if clean_snippet in seen:
               continue
-            mention = SourceUsedMention(
-              source_used_id=source_used.id,
-              response_id=response.id,
-              mention_index=mention_idx,
-              snippet_cited=clean_snippet,
-              metadata_json={
+            mention_rows.append((source_used_index, {
+              "response_id": response.id,
+              "mention_index": mention_idx,
+              "snippet_cited": clean_snippet,
+              "metadata_json": {
                 "citation_number": (metadata or {}).get("citation_number"),
               },
-            )
-            self.db.add(mention)
+            }))
             seen.add(clean_snippet)
             mention_idx += 1
-          mention_counts[source_used.id] = mention_idx
+          mention_counts[source_used_index] = mention_idx
+
+      source_used_ids = self._insert_returning_ids(SourceUsed, SourceUsed.id, source_used_rows)
+      if mention_rows:
+        # Mention ids are never read back, so a plain executemany suffices
+        self.db.execute(
+          insert(SourceUsedMention),
+          [{**row, "source_used_id": source_used_ids[index]} for index, row in mention_rows],
+        )
 
       self.db.commit()
       return response.id
@@ -457,10 +486,32 @@ class InteractionRepository:
       self.db.rollback()
       raise
 
+  def _insert_returning_ids(
+    self,
+    model: type[Base],
+    id_column: InstrumentedAttribute[int],
+    rows: List[dict],
+  ) -> List[int]:
+    """Bulk insert rows for a model and return their ids in row order.
+
+    Args:
+      model: ORM model class to insert into
+      id_column: The model's primary key attribute
+      rows: Column values keyed by attribute name, one dict per row
+
+    Returns:
+      Generated primary keys, aligned with rows
+    """
+    if not rows:
+      return []
+    statement = insert(model).returning(id_column, sort_by_parameter_order=True)
+    return list(self.db.scalars(statement, rows))
+
   def get_by_id(self, response_id: int) -> Optional[Response]:
     """Get interaction by response ID with eager loading.
 
-    Uses joinedload to prevent N+1 query problem.
+    Uses eager loading (joined parents, selectin collections) to prevent
+    N+1 queries.
 
     Args:
       response_id: The response ID
@@ -470,14 +521,7 @@ class InteractionRepository:
     """
     return (
       self.db.query(Response)
-      .options(
-        joinedload(Response.interaction)
-        .joinedload(InteractionModel.provider),
-        joinedload(Response.search_queries)
-        .joinedload(SearchQuery.sources),
-        joinedload(Response.sources_used).joinedload(SourceUsed.mentions),
-        joinedload(Response.response_sources),
-      )
+      .options(*_RESPONSE_LOAD_OPTIONS)
       .filter_by(id=response_id)
       .first()
     )
@@ -511,15 +555,7 @@ class InteractionRepository:
       self.db.query(Response)
       .join(Response.interaction)
       .join(InteractionModel.provider)
-      .options(
-        defer(Response.raw_response_json),
-        joinedload(Response.interaction)
-        .joinedload(InteractionModel.provider),
-        joinedload(Response.search_queries)
-        .joinedload(SearchQuery.sources),
-        joinedload(Response.sources_used).joinedload(SourceUsed.mentions),
-        joinedload(Response.response_sources),
-      )
+      .options(defer(Response.raw_response_json), *_RESPONSE_LOAD_OPTIONS)
     )
 
     # Apply filters
@@ -617,17 +653,6 @@ class InteractionRepository:
     Returns:
       Dict containing total analyses and averaged metrics.
     """
-    total_analyses = self.db.query(func.count(Response.id)).scalar() or 0
-    if total_analyses == 0:
-      return {
-        "analyses": 0,
-        "avg_response_time_ms": None,
-        "avg_searches": None,
-        "avg_sources_found": None,
-        "avg_sources_used": None,
-        "avg_rank": None,
-      }
-
     search_counts_subquery = (
       self.db.query(
         SearchQuery.response_id.label("response_id"),
@@ -637,17 +662,36 @@ class InteractionRepository:
       .subquery()
     )
 
-    avg_searches = self.db.query(
-      func.avg(func.coalesce(search_counts_subquery.c.count, 0))
+    # One round trip: the outer join keeps exactly one row per response, so every
+    # aggregate sees the same population as the old per-metric queries.
+    (
+      total_analyses,
+      avg_response_time,
+      avg_searches,
+      avg_sources_found,
+      avg_sources_used,
+      avg_rank,
+    ) = self.db.query(
+      func.count(Response.id),
+      func.avg(Response.response_time_ms),
+      func.avg(func.coalesce(search_counts_subquery.c.count, 0)),
+      func.avg(func.coalesce(Response.sources_found, 0)),
+      func.avg(func.coalesce(Response.sources_used_count, 0)),
+      func.avg(Response.avg_rank),
     ).select_from(Response).outerjoin(
       search_counts_subquery,
       Response.id == search_counts_subquery.c.response_id
-    ).scalar()
+    ).one()
 
-    avg_response_time = self.db.query(func.avg(Response.response_time_ms)).scalar()
-    avg_sources_found = self.db.query(func.avg(func.coalesce(Response.sources_found, 0))).scalar()
-    avg_sources_used = self.db.query(func.avg(func.coalesce(Response.sources_used_count, 0))).scalar()
-    avg_rank = self.db.query(func.avg(Response.avg_rank)).scalar()
+    if not total_analyses:
+      return {
+        "analyses": 0,
+        "avg_response_time_ms": None,
+        "avg_searches": None,
+        "avg_sources_found": None,
+        "avg_sources_used": None,
+        "avg_rank": None,
+      }
 
     def _as_float(value):
       return float(value) if value is not None else None
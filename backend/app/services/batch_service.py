@@ -15,7 +15,7 @@ from uuid import uuid4
 from sqlalchemy.orm import Session
 
 from app.api.v1.schemas.requests import BatchRequest
-from app.api.v1.schemas.responses import BatchStatus, SendPromptResponse
+from app.api.v1.schemas.responses import BatchStatus, SendPromptResponse, SendPromptResponseCore
 from app.config import settings
 from app.repositories.interaction_repository import InteractionRepository
 from app.services.interaction_service import InteractionService
@@ -45,7 +45,7 @@ class _BatchJob:
   completed_at: Optional[datetime] = None
   cancel_requested: bool = False
   cancel_reason: Optional[str] = None
-  results: List[SendPromptResponse] = field(default_factory=list)
+  results: List[SendPromptResponseCore] = field(default_factory=list)
   errors: List[Dict[str, str]] = field(default_factory=list)
   completed_tasks: int = 0
   failed_tasks: int = 0
@@ -135,7 +135,7 @@ class BatchService:
     max_workers = max(1, settings.BATCH_MAX_CONCURRENCY)
     self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-worker")
     self._default_provider_limit = max(1, settings.BATCH_PER_PROVIDER_CONCURRENCY)
-    self._provider_limits = settings.get_batch_provider_limits()
+    self._provider_limits = settings.batch_provider_limits
 
   def _create_job(self, tasks: List[_BatchTask]) -> _BatchJob:
     batch_id = str(uuid4())
@@ -18,7 +18,7 @@ from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import settings
-from app.core.utils import extract_domain
+from app.core.utils import extract_domain, json_deserializer, json_serializer
 from app.models.database import Response, SourceUsed, SourceUsedMention
 from app.services.citation_tagging_service import (
   CitationInfluenceService,
@@ -34,7 +34,12 @@ def _create_session_factory() -> sessionmaker:
   connect_args = {}
   if "sqlite" in settings.DATABASE_URL:
     connect_args = {"check_same_thread": False, "timeout": 30}
-  engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
+  engine = create_engine(
+    settings.DATABASE_URL,
+    connect_args=connect_args,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+  )
   return sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
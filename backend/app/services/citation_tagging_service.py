@@ -6,7 +6,7 @@ import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, FrozenSet, List, Literal, Optional
 
 from google.genai import Client as GoogleClient  # type: ignore[import-untyped]
 from google.genai.types import GenerateContentConfig  # type: ignore[import-untyped]
@@ -49,6 +49,10 @@ PROVENANCE_TAGS = [
   "blog",
   "legal_or_policy",
 ]
+# Set views of the vocabularies for O(1) membership checks when filtering model output
+_FUNCTION_TAG_SET = frozenset(FUNCTION_TAGS)
+_STANCE_TAG_SET = frozenset(STANCE_TAGS)
+_PROVENANCE_TAG_SET = frozenset(PROVENANCE_TAGS)
 
 PROMPT_TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "prompts" / "citation_tagging_prompt.md"
 PROMPT_TEMPLATE = PROMPT_TEMPLATE_PATH.read_text(encoding="utf-8")
@@ -473,20 +477,22 @@ class CitationTaggingService:
         provenance_tags=self._default_provenance(citation),
       )
 
-    def _filter(values: Any, allowed: List[str]) -> List[str]:
+    def _filter(values: Any, allowed: FrozenSet[str]) -> List[str]:
       if not isinstance(values, list):
         return []
       cleaned = []
+      seen = set()
       for item in values:
         if isinstance(item, str):
           token = item.strip()
-          if token in allowed and token not in cleaned:
+          if token in allowed and token not in seen:
+            seen.add(token)
             cleaned.append(token)
       return cleaned
 
-    function_tags = _filter(raw.get("function_tags"), FUNCTION_TAGS)
-    stance_tags = _filter(raw.get("stance_tags"), STANCE_TAGS)
-    provenance_tags = _filter(raw.get("provenance_tags"), PROVENANCE_TAGS)
+    function_tags = _filter(raw.get("function_tags"), _FUNCTION_TAG_SET)
+    stance_tags = _filter(raw.get("stance_tags"), _STANCE_TAG_SET)
+    provenance_tags = _filter(raw.get("provenance_tags"), _PROVENANCE_TAG_SET)
     if not provenance_tags:
       provenance_tags = self._default_provenance(citation)
 
@@ -499,7 +505,7 @@ class CitationTaggingService:
   def _default_provenance(self, citation: Dict[str, Any]) -> List[str]:
     metadata = citation.get("metadata") or {}
     ref_type = (metadata.get("ref_id") or {}).get("ref_type")
-    if isinstance(ref_type, str) and ref_type in PROVENANCE_TAGS:
+    if isinstance(ref_type, str) and ref_type in _PROVENANCE_TAG_SET:
       return [ref_type]
     return []
 
@@ -1,7 +1,6 @@
 """Service layer for interaction business logic."""
 
 from datetime import datetime
-from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import TypeAdapter, ValidationError
@@ -73,6 +72,7 @@ class InteractionService:
     extra_links_count: int = 0,
     sources: Optional[List[dict]] = None,
     enable_citation_tagging: Optional[bool] = None,
+    metadata_validated: bool = False,
   ) -> int:
     """Save interaction with business logic applied.
 
@@ -94,6 +94,8 @@ class InteractionService:
       extra_links_count: Number of extra links
       sources: List of source dicts linked directly to response (for web capture mode)
       enable_citation_tagging: Optional per-interaction override (web captures only)
+      metadata_validated: Source/citation metadata already went through
+        ``dump_metadata`` (e.g. via the request schemas), so skip re-validating it
 
     Returns:
       The response ID
@@ -101,9 +103,9 @@ class InteractionService:
     # Normalize model name (e.g., gpt-5-1 → gpt-5.1)
     normalized_model = normalize_model_name(model)
 
-    normalized_queries = self._normalize_search_queries(search_queries)
-    normalized_citations = self._normalize_citations(citations)
-    normalized_sources = self._normalize_sources(sources)
+    normalized_queries = self._normalize_search_queries(search_queries, metadata_validated)
+    normalized_citations = self._normalize_citations(citations, metadata_validated)
+    normalized_sources = self._normalize_sources(sources, metadata_validated)
     normalized_raw_response = self._normalize_raw_response(raw_response)
 
     # Extract domains from search query sources
@@ -131,12 +133,10 @@ class InteractionService:
       sources_found = sum(len(q.get("sources", [])) for q in normalized_queries)
 
     # sources_used: Count of citations with rank (from search results)
-    sources_used = len([c for c in normalized_citations if c.get("rank") is not None])
-
-    # avg_rank: Average rank of citations (excluding None)
-    # Convert dicts to objects for calculate_average_rank
-    citation_objects = [SimpleNamespace(**c) for c in normalized_citations]
-    avg_rank = calculate_average_rank(citation_objects)
+    # avg_rank: Average of numeric citation ranks
+    # Both are stored on the response row so detail reads never recompute them.
+    sources_used = sum(1 for c in normalized_citations if c.get("rank") is not None)
+    avg_rank = calculate_average_rank(normalized_citations)
 
     # Save to database
     return self.repository.save(
@@ -273,7 +273,7 @@ class InteractionService:
       else:
         provider_display = ""
       prompt_text = interaction.prompt_text if interaction else ""
-      summary = InteractionSummary(
+      summary = InteractionSummary.from_trusted(
         interaction_id=response.id,
         prompt=prompt_text,
         provider=provider_display,
@@ -309,11 +309,13 @@ class InteractionService:
     if not response:
       return None
 
-    # Convert search queries to schemas
+    # Convert search queries to schemas. Query sources are built once and the
+    # same instances are reused for all_sources in API mode.
     search_queries = []
+    query_sources: List[SourceSchema] = []
     for query in (response.search_queries or []):
       sources = [
-        SourceSchema(
+        SourceSchema.from_trusted(
           url=s.url,
           title=s.title,
           domain=s.domain,
@@ -326,9 +328,10 @@ class InteractionService:
         )
         for s in (query.sources or [])
       ]
+      query_sources.extend(sources)
 
       search_queries.append(
-        SearchQuerySchema(
+        SearchQuerySchema.from_trusted(
           query=query.search_query or "",
           sources=sources,
           timestamp=query.created_at.isoformat() if query.created_at else None,
@@ -347,7 +350,7 @@ class InteractionService:
       for mention in sorted(getattr(c, "mentions", []) or [], key=lambda m: m.mention_index):
         mention_metadata = mention.metadata_json or {}
         mentions.append(
-          CitationMentionSchema(
+          CitationMentionSchema.from_trusted(
             mention_index=mention.mention_index,
             start_index=mention.start_index,
             end_index=mention.end_index,
@@ -360,7 +363,7 @@ class InteractionService:
           )
         )
       citations.append(
-        CitationSchema(
+        CitationSchema.from_trusted(
           url=c.url,
           title=c.title,
           rank=c.rank,
@@ -385,7 +388,7 @@ class InteractionService:
     if response.data_source in ('web', 'network_log') and response.response_sources:
       # Network_log: sources are directly on response
       all_sources = [
-        SourceSchema(
+        SourceSchema.from_trusted(
           url=s.url,
           title=s.title,
           domain=s.domain,
@@ -399,22 +402,8 @@ class InteractionService:
         for s in (response.response_sources or [])
       ]
     else:
-      # API: gather all sources from search queries
-      for query in (response.search_queries or []):
-        for s in (query.sources or []):
-          all_sources.append(
-            SourceSchema(
-              url=s.url,
-              title=s.title,
-              domain=s.domain,
-              rank=s.rank,
-              pub_date=s.pub_date,
-              search_description=None,
-              snippet_text=None,
-              internal_score=s.internal_score,
-              metadata=s.metadata_json,
-            )
-          )
+      # API: all sources from search queries, sharing the per-query instances
+      all_sources = query_sources
 
     # Use stored computed metrics from database
     interaction = response.interaction
@@ -466,7 +455,7 @@ class InteractionService:
         "annotated_citations": citations_annotated,
       }
 
-    return SendPromptResponse(
+    return SendPromptResponse.from_trusted(
       prompt=prompt_text,
       response_text=formatted_response,
       search_queries=search_queries,
@@ -500,6 +489,7 @@ class InteractionService:
     raw_response: Optional[dict],
     extra_links_count: int = 0,
     enable_citation_tagging: bool = True,
+    metadata_validated: bool = False,
   ) -> SendPromptResponse:
     """Save web capture interaction and return formatted response.
 
@@ -518,6 +508,7 @@ class InteractionService:
       raw_response: Raw response data
       extra_links_count: Number of extra links
       enable_citation_tagging: Whether to queue citation tagging for this web capture
+      metadata_validated: Metadata was already normalized by the request schemas
 
     Returns:
       SendPromptResponse with interaction_id and all data
@@ -536,6 +527,7 @@ class InteractionService:
       extra_links_count=extra_links_count,
       sources=sources,
       enable_citation_tagging=enable_citation_tagging,
+      metadata_validated=metadata_validated,
     )
 
     # Mark citation tagging status so the API can enqueue work without blocking the request.
@@ -567,14 +559,14 @@ class InteractionService:
     except ValidationError as exc:
       raise ValueError(f"Invalid raw_response payload: {exc}") from exc
 
-  def _normalize_search_queries(self, search_queries: List[dict]) -> List[dict]:
+  def _normalize_search_queries(self, search_queries: List[dict], metadata_validated: bool = False) -> List[dict]:
     normalized = []
     for query in search_queries or []:
       if not isinstance(query, dict):
         raise ValueError("Each search query must be an object")
       normalized_query = dict(query)
       sources = normalized_query.get("sources", []) or []
-      normalized_query["sources"] = [self._normalize_source_dict(src) for src in sources]
+      normalized_query["sources"] = [self._normalize_source_dict(src, metadata_validated) for src in sources]
 
       if "internal_ranking_scores" in normalized_query:
         normalized_query["internal_ranking_scores"] = self._ensure_optional_dict(
@@ -593,28 +585,30 @@ class InteractionService:
       normalized.append(normalized_query)
     return normalized
 
-  def _normalize_sources(self, sources: Optional[List[dict]]) -> Optional[List[dict]]:
+  def _normalize_sources(self, sources: Optional[List[dict]], metadata_validated: bool = False) -> Optional[List[dict]]:
     if not sources:
       return None
-    return [self._normalize_source_dict(source) for source in sources]
+    return [self._normalize_source_dict(source, metadata_validated) for source in sources]
 
-  def _normalize_source_dict(self, source: dict) -> dict:
+  def _normalize_source_dict(self, source: dict, metadata_validated: bool = False) -> dict:
     if not isinstance(source, dict):
       raise ValueError("Source entries must be objects")
     normalized = dict(source)
-    normalized["metadata"] = self._normalize_source_metadata(normalized.get("metadata"))
+    if not metadata_validated:
+      normalized["metadata"] = self._normalize_source_metadata(normalized.get("metadata"))
     return normalized
 
   def _normalize_source_metadata(self, metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     return dump_metadata(SourceMetadata, metadata)
 
-  def _normalize_citations(self, citations: List[dict]) -> List[dict]:
+  def _normalize_citations(self, citations: List[dict], metadata_validated: bool = False) -> List[dict]:
     normalized = []
     for citation in citations or []:
       if not isinstance(citation, dict):
         raise ValueError("Citation entries must be objects")
       normalized_citation = dict(citation)
-      normalized_citation["metadata"] = dump_metadata(CitationMetadata, normalized_citation.get("metadata"))
+      if not metadata_validated:
+        normalized_citation["metadata"] = dump_metadata(CitationMetadata, normalized_citation.get("metadata"))
       normalized.append(normalized_citation)
     return normalized
 
@@ -0,0 +1,28 @@
+"""Add response lookup indexes.
+
+Revision ID: 5c3e9a7d2b14
+Revises: b9268ada5b0a
+Create Date: 2026-10-18 10:12:05.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5c3e9a7d2b14'
+down_revision: Union[str, None] = 'b9268ada5b0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+  with op.batch_alter_table("responses") as batch:
+    batch.create_index("ix_responses_interaction_id", ["interaction_id"], unique=False)
+    batch.create_index("ix_responses_data_source_created_at", ["data_source", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+  with op.batch_alter_table("responses") as batch:
+    batch.drop_index("ix_responses_data_source_created_at")
+    batch.drop_index("ix_responses_interaction_id")
@@ -0,0 +1,45 @@
+"""Use JSONB for JSON columns on PostgreSQL.
+
+Revision ID: 8d2f6e4a9c31
+Revises: 5c3e9a7d2b14
+Create Date: 2026-10-18 11:02:47.190264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f6e4a9c31'
+down_revision: Union[str, None] = '5c3e9a7d2b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = {
+  "interactions": ["metadata_json"],
+  "responses": ["raw_response_json"],
+  "search_queries": ["internal_ranking_scores", "query_reformulations"],
+  "query_sources": ["metadata_json"],
+  "response_sources": ["metadata_json"],
+  "sources_used": ["metadata_json", "function_tags", "stance_tags", "provenance_tags"],
+  "source_used_mentions": ["metadata_json", "function_tags", "stance_tags", "provenance_tags"],
+}
+
+
+def _convert(target_type: str) -> None:
+  # SQLite (and other backends) keep the generic JSON type; only PostgreSQL has JSONB.
+  if op.get_bind().dialect.name != "postgresql":
+    return
+  for table, columns in JSON_COLUMNS.items():
+    for column in columns:
+      op.execute(
+        f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {target_type} USING {column}::{target_type}'
+      )
+
+
+def upgrade() -> None:
+  _convert("jsonb")
+
+
+def downgrade() -> None:
+  _convert("json")
@@ -64,8 +64,9 @@ class TestHealthEndpoints:
     assert data["status"] == "running"
     assert data["docs"] == "/docs"
 
-  def test_health_check_endpoint(self, client):
+  def test_health_check_endpoint(self, client, monkeypatch):
     """Test health check endpoint."""
+    monkeypatch.setattr("app.main._health_cache", None)
     response = client.get("/health")
     assert response.status_code == 200
     data = response.json()
@@ -205,6 +206,7 @@ class TestInteractionsEndpoints:
     assert "error" in data
     assert data["error"]["code"] == "VALIDATION_ERROR"
     assert "Request validation failed" in data["error"]["message"]
+    assert data["error"]["details"]["errors"][0]["field"] == "body -> prompt"
 
   def test_send_prompt_unsupported_model(self, client):
     """Test POST /api/v1/interactions/send with unsupported model."""
@@ -222,6 +224,108 @@ class TestInteractionsEndpoints:
     # Error is wrapped in custom error handler format
 
 
+class TestResponseClass:
+  """Tests for the default JSON response class."""
+
+  def test_included_routes_use_fast_json_response(self):
+    """Test routes from the v1 routers inherit the app's default response class."""
+    from fastapi.routing import APIRoute
+
+    from app.core.responses import FastJSONResponse
+
+    routes = {route.path: route for route in app.routes if isinstance(route, APIRoute)}
+    assert routes["/"].response_class is FastJSONResponse
+    assert routes["/api/v1/interactions/batch"].response_class is FastJSONResponse
+
+  def test_body_matches_stdlib_json_response(self):
+    """Test rendering matches JSONResponse byte-for-byte for plain JSON content."""
+    from fastapi.responses import JSONResponse
+
+    from app.core.responses import FastJSONResponse
+
+    content = {"name": "caf\u00e9", "items": [1, 2.5, None, True], "nested": {"a": "b"}}
+    assert FastJSONResponse(content).body == JSONResponse(content).body
+
+  def test_non_finite_floats_rendered_as_null(self):
+    """Test NaN/Infinity become null instead of failing the response like JSONResponse does."""
+    from fastapi.responses import JSONResponse
+
+    from app.core.responses import FastJSONResponse
+
+    content = {"avg_rank": float("nan"), "scores": [float("inf"), float("-inf"), 1.5]}
+    assert FastJSONResponse(content).body == b'{"avg_rank":null,"scores":[null,null,1.5]}'
+    with pytest.raises(ValueError):
+      JSONResponse(content)
+
+
+class TestOpenAPISchema:
+  """Tests for the pre-encoded OpenAPI schema route."""
+
+  def test_openapi_served_from_cached_bytes(self, client, monkeypatch):
+    """Test /openapi.json matches app.openapi() and is encoded only once."""
+    import app.main as main_module
+
+    monkeypatch.setattr(main_module, "_openapi_bytes", None)
+
+    first = client.get("/openapi.json")
+    cached = main_module._openapi_bytes
+    second = client.get("/openapi.json")
+
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert first.json() == app.openapi()
+    assert "/health" in first.json()["paths"]
+    assert second.content == first.content
+    assert main_module._openapi_bytes is cached
+
+  def test_openapi_lists_proxy_root_path_as_server(self, monkeypatch):
+    """Test a proxy root_path is added to servers, as FastAPI's stock route does."""
+    import app.main as main_module
+
+    monkeypatch.setattr(main_module, "_openapi_bytes", None)
+    monkeypatch.setattr(main_module, "_openapi_server_urls", set())
+    monkeypatch.setattr(app, "openapi_schema", None)
+    monkeypatch.setattr(app, "servers", [])
+
+    response = TestClient(app, root_path="/proxy").get("/openapi.json")
+
+    assert response.status_code == 200
+    assert response.json()["servers"] == [{"url": "/proxy"}]
+
+  def test_docs_page_still_served(self, client):
+    """Test Swagger UI still points at the schema route."""
+    response = client.get("/docs")
+
+    assert response.status_code == 200
+    assert "/openapi.json" in response.text
+
+
+class TestEndpointConcurrency:
+  """Tests for how blocking endpoints are scheduled."""
+
+  @pytest.mark.parametrize("endpoint", [
+    "send_prompt",
+    "save_network_log_data",
+    "get_recent_interactions",
+    "get_interaction_details",
+    "export_interaction_markdown",
+    "delete_interaction",
+  ])
+  def test_blocking_endpoints_run_in_threadpool(self, endpoint):
+    """Test DB/provider-bound handlers are sync so they don't block the event loop."""
+    import inspect
+
+    assert not inspect.iscoroutinefunction(getattr(interactions_endpoint, endpoint))
+
+  def test_health_check_runs_in_threadpool(self):
+    """Test the health check's sync database probe stays off the event loop."""
+    import inspect
+
+    from app.main import health_check
+
+    assert not inspect.iscoroutinefunction(health_check)
+
+
 class _StubBatchService:
   """Simple stub used to test batch endpoints."""
 
@@ -320,6 +424,8 @@ class TestBatchEndpoints:
       assert status_body["status"] == "completed"
       assert status_body["completed_tasks"] == 2
       assert len(status_body["results"]) == 1
+      assert "raw_response" not in status_body["results"][0]
+      assert "metadata" not in status_body["results"][0]
       assert stub.last_status_batch_id == "stub-batch"
     finally:
       app.dependency_overrides.pop(get_batch_service, None)
@@ -0,0 +1,111 @@
+"""Tests for application settings."""
+
+from pathlib import Path
+
+import pytest
+
+from app.config import (
+  APP_DB_PATH,
+  BACKEND_FALLBACK_URL,
+  DEFAULT_DB_URL,
+  LEGACY_DB_URLS,
+  Settings,
+  _app_db_path_exists,
+  get_settings,
+  settings,
+)
+
+
+class TestGetSettings:
+  """Tests for the cached settings factory."""
+
+  def test_returns_cached_instance(self):
+    """Test get_settings returns the module-level instance on every call."""
+    assert get_settings() is settings
+    assert get_settings() is get_settings()
+
+
+class TestBatchProviderLimits:
+  """Tests for per-provider batch concurrency limits."""
+
+  def test_overrides_and_defaults(self):
+    """Test provider overrides win over the per-provider default."""
+    custom = Settings(BATCH_PER_PROVIDER_CONCURRENCY=3, BATCH_MAX_CONCURRENCY_GOOGLE=5)
+
+    assert dict(custom.batch_provider_limits) == {"openai": 3, "google": 5, "anthropic": 3}
+
+  def test_cached_and_read_only(self):
+    """Test the limits are computed once and cannot be mutated by callers."""
+    custom = Settings()
+
+    assert custom.batch_provider_limits is custom.batch_provider_limits
+    with pytest.raises(TypeError):
+      custom.batch_provider_limits["openai"] = 99
+
+
+class TestNormalizeDatabaseUrl:
+  """Tests for DATABASE_URL normalization."""
+
+  @pytest.mark.parametrize("legacy_url", sorted(LEGACY_DB_URLS))
+  def test_legacy_urls_normalized(self, legacy_url):
+    """Test legacy URLs resolve to the default or backend fallback location."""
+    custom = Settings(DATABASE_URL=legacy_url)
+
+    assert custom.DATABASE_URL in (DEFAULT_DB_URL, BACKEND_FALLBACK_URL)
+
+  def test_custom_url_untouched(self):
+    """Test non-legacy URLs pass through unchanged."""
+    custom = Settings(DATABASE_URL="sqlite:///:memory:")
+
+    assert custom.DATABASE_URL == "sqlite:///:memory:"
+
+  def test_app_db_path_checked_once(self, monkeypatch):
+    """Test the /app/data existence check is cached across Settings instances."""
+    calls = []
+    original_exists = Path.exists
+
+    def counting_exists(path, *args, **kwargs):
+      if path == APP_DB_PATH:
+        calls.append(path)
+      return original_exists(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", counting_exists)
+    _app_db_path_exists.cache_clear()
+    try:
+      Settings(DATABASE_URL=DEFAULT_DB_URL)
+      Settings(DATABASE_URL=DEFAULT_DB_URL)
+    finally:
+      _app_db_path_exists.cache_clear()
+
+    assert len(calls) == 1
+
+
+class TestLazySettings:
+  """Tests for the lazily built module-level settings instance."""
+
+  def test_settings_bound_after_first_access(self):
+    """Test module attribute access returns and binds the cached instance."""
+    import app.config as config_module
+
+    assert config_module.settings is get_settings()
+    assert vars(config_module)["settings"] is get_settings()
+
+  def test_unknown_attribute_raises(self):
+    """Test unknown module attributes still raise AttributeError."""
+    import app.config as config_module
+
+    with pytest.raises(AttributeError):
+      getattr(config_module, "not_a_setting")
+
+
+class TestCorsOrigins:
+  """Tests for CORS origin settings."""
+
+  def test_origins_immutable_with_set_view(self, monkeypatch):
+    """Test env-provided origins load as a tuple with a cached frozenset view."""
+    monkeypatch.setenv("CORS_ORIGINS", '["http://a.test", "http://b.test"]')
+    custom = Settings()
+
+    assert custom.CORS_ORIGINS == ("http://a.test", "http://b.test")
+    assert custom.cors_origins_set == frozenset({"http://a.test", "http://b.test"})
+    assert custom.cors_origins_set is custom.cors_origins_set
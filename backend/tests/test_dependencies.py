@@ -0,0 +1,55 @@
+"""Tests for database engine configuration."""
+
+from sqlalchemy.pool import StaticPool
+
+from app.config import settings
+from app.dependencies import (
+  _engine_options,
+  citation_tagger_instance,
+  get_export_service,
+  get_provider_service,
+)
+
+
+class TestEngineOptions:
+  """Tests for backend-specific engine pool settings."""
+
+  def test_memory_sqlite_uses_static_pool(self):
+    """Test in-memory SQLite shares a single connection."""
+    options = _engine_options("sqlite:///:memory:")
+
+    assert options["poolclass"] is StaticPool
+    assert options["connect_args"] == {"check_same_thread": False}
+
+  def test_file_sqlite_waits_on_locks(self):
+    """Test file-backed SQLite gets a busy timeout and no pool sizing."""
+    options = _engine_options("sqlite:////tmp/app.db")
+
+    assert options == {"connect_args": {"check_same_thread": False, "timeout": 30}}
+
+  def test_server_database_uses_pool_settings(self):
+    """Test server databases get a sized, pre-pinged pool from settings."""
+    options = _engine_options("postgresql://user:pw@localhost/db")
+
+    assert options == {
+      "pool_size": settings.DB_POOL_SIZE,
+      "max_overflow": settings.DB_MAX_OVERFLOW,
+      "pool_recycle": settings.DB_POOL_RECYCLE,
+      "pool_timeout": settings.DB_POOL_TIMEOUT,
+      "pool_pre_ping": True,
+    }
+
+
+class TestServiceDependencies:
+  """Tests for the flattened service dependency providers."""
+
+  def test_services_built_directly_from_session(self):
+    """Test provider/export services wrap a repository bound to the given session."""
+    db = object()
+
+    provider_service = get_provider_service(db)
+    export_service = get_export_service(db)
+
+    for service in (provider_service, export_service):
+      assert service.interaction_service.repository.db is db
+      assert service.interaction_service.citation_tagger is citation_tagger_instance
@@ -6,6 +6,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.exceptions import (
+  ERROR_CODE_REFERENCE,
   APIException,
   DatabaseError,
   InvalidRequestError,
@@ -81,6 +82,17 @@ class TestExceptionHandlers:
     assert data["error"]["code"] == "VALIDATION_ERROR"
     assert "Test validation error" in data["error"]["message"]
     assert data["error"]["details"]["field"] == "test"
+    assert response.headers["content-type"] == "application/json"
+
+  def test_api_exception_to_json_matches_to_dict(self):
+    """Test the JSON payload mirrors to_dict and omits empty details."""
+    import json
+
+    error = InvalidRequestError("Bad input")
+
+    assert json.loads(error.to_json()) == error.to_dict()
+    assert "details" not in error.to_dict()["error"]
+    assert error.details is None
 
   def test_api_exception_handler_resource_not_found(self, test_app):
     """Test APIException handler for ResourceNotFoundError."""
@@ -147,12 +159,13 @@ class TestExceptionHandlers:
 class TestHealthCheckWithDatabaseError:
   """Tests for health check endpoint with database errors."""
 
-  def test_health_check_database_failure(self):
+  def test_health_check_database_failure(self, monkeypatch):
     """Test health check returns 503 when database is unavailable."""
     from unittest.mock import MagicMock, patch
 
     from app.main import app
 
+    monkeypatch.setattr("app.main._health_cache", None)
     client = TestClient(app)
 
     # Mock the database engine to raise an exception
@@ -168,3 +181,51 @@ class TestHealthCheckWithDatabaseError:
       assert data["status"] == "unhealthy"
       assert data["database"] == "error"
       assert "error" in data
+
+  def test_health_check_result_cached_briefly(self, monkeypatch):
+    """Test repeated probes within the TTL reuse the last database check."""
+    from unittest.mock import MagicMock, patch
+
+    from app.main import app
+
+    monkeypatch.setattr("app.main._health_cache", None)
+    client = TestClient(app)
+
+    with patch('app.main.engine') as mock_engine:
+      mock_engine.connect.return_value.__enter__.return_value = MagicMock()
+
+      assert client.get("/health").status_code == 200
+      assert client.get("/health").status_code == 200
+      assert mock_engine.connect.call_count == 1
+
+      monkeypatch.setattr("app.main.HEALTH_CACHE_TTL_SECONDS", 0.0)
+      assert client.get("/health").status_code == 200
+      assert mock_engine.connect.call_count == 2
+
+
+class TestExceptionClasses:
+  """Tests for exception class-level error metadata."""
+
+  def test_codes_are_class_attributes(self):
+    """Test subclasses expose error code and status without per-instance storage."""
+    error = ResourceNotFoundError(resource_type="Interaction", resource_id=1)
+
+    assert ResourceNotFoundError.error_code == "RESOURCE_NOT_FOUND"
+    assert error.status_code == 404
+    assert "error_code" not in vars(error)
+    assert "status_code" not in vars(error)
+
+  def test_base_exception_overrides(self):
+    """Test APIException still accepts an explicit code and status."""
+    error = APIException(message="boom", error_code="PROVIDER_API_ERROR", status_code=502)
+
+    assert error.to_dict()["error"]["code"] == "PROVIDER_API_ERROR"
+    assert error.status_code == 502
+    assert APIException.error_code == "INTERNAL_SERVER_ERROR"
+
+  def test_error_code_reference_is_read_only(self):
+    """Test every class code is documented and the reference can't be mutated."""
+    for exc_cls in (ValidationError, ResourceNotFoundError, InvalidRequestError, DatabaseError):
+      assert exc_cls.error_code in ERROR_CODE_REFERENCE
+    with pytest.raises(TypeError):
+      ERROR_CODE_REFERENCE["NEW_CODE"] = "nope"
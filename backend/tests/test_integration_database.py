@@ -600,3 +600,21 @@ class TestEdgeCaseQueries:
         # Should return all 3, not crash or error
         assert total == 3
         assert len(results) == 3
+
+
+class TestJsonColumnTypes:
+    """Tests for dialect-specific JSON column storage."""
+
+    def test_json_columns_use_jsonb_on_postgresql_only(self):
+        """Test JSON columns compile to JSONB for PostgreSQL and plain JSON for SQLite."""
+        from sqlalchemy.dialects import postgresql, sqlite
+        from sqlalchemy.schema import CreateTable
+
+        table = Response.__table__
+
+        postgres_ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+        sqlite_ddl = str(CreateTable(table).compile(dialect=sqlite.dialect()))
+
+        assert "raw_response_json JSONB" in postgres_ddl
+        assert "raw_response_json JSON" in sqlite_ddl
+        assert "JSONB" not in sqlite_ddl
@@ -1,12 +1,17 @@
 """Tests for middleware components."""
 
+import asyncio
+import logging
+
 import pytest
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
 from app.core.middleware import (
-  CorrelationIDMiddleware,
+  CorrelationIdFilter,
   LoggingMiddleware,
+  correlation_id_var,
   get_correlation_id,
 )
 
@@ -32,8 +37,21 @@ class TestLoggingMiddleware:
     async def test_correlation_endpoint(request: Request):
       return {"correlation_id": get_correlation_id(request)}
 
+    @app.get("/test-context")
+    def test_context_endpoint():
+      return {"correlation_id": get_correlation_id()}
+
     return app
 
+  def test_correlation_id_available_without_request(self, app_with_logging):
+    """Test sync handlers can read the correlation ID from the context variable."""
+    client = TestClient(app_with_logging)
+
+    response = client.get("/test-context", headers={"X-Correlation-ID": "ctx-123"})
+
+    assert response.json() == {"correlation_id": "ctx-123"}
+    assert correlation_id_var.get() == "no-correlation-id"
+
   def test_request_with_correlation_id_header(self, app_with_logging):
     """Test that custom correlation ID is preserved."""
     client = TestClient(app_with_logging)
@@ -57,6 +75,17 @@ class TestLoggingMiddleware:
     assert "X-Correlation-ID" in response.headers
     assert len(response.headers["X-Correlation-ID"]) > 0
 
+  def test_generated_correlation_ids_are_unique_hex_tokens(self, app_with_logging):
+    """Test generated correlation IDs are 128-bit hex tokens that differ per request."""
+    client = TestClient(app_with_logging)
+
+    first = client.get("/test").headers["X-Correlation-ID"]
+    second = client.get("/test").headers["X-Correlation-ID"]
+
+    assert len(first) == 32
+    int(first, 16)
+    assert first != second
+
   def test_correlation_id_available_in_endpoint(self, app_with_logging):
     """Test that correlation ID is available via get_correlation_id."""
     client = TestClient(app_with_logging)
@@ -73,7 +102,6 @@ class TestLoggingMiddleware:
 
   def test_middleware_handles_exceptions(self, app_with_logging, caplog):
     """Test that middleware logs exceptions and re-raises them."""
-    import logging
     client = TestClient(app_with_logging, raise_server_exceptions=False)
 
     with caplog.at_level(logging.ERROR):
@@ -90,7 +118,6 @@ class TestLoggingMiddleware:
 
   def test_success_responses_logged_at_info_level(self, app_with_logging, caplog):
     """Test that 2xx responses are logged at info level."""
-    import logging
     client = TestClient(app_with_logging)
 
     with caplog.at_level(logging.INFO):
@@ -101,15 +128,67 @@ class TestLoggingMiddleware:
     # Verify successful request was logged
     assert any("Request completed" in record.message and record.levelname == "INFO" for record in caplog.records)
 
+  def test_request_started_log_includes_headers_and_query(self, app_with_logging, caplog):
+    """Test user agent and query string are read from the raw ASGI scope."""
+    client = TestClient(app_with_logging)
+
+    with caplog.at_level(logging.INFO, logger="app.core.middleware"):
+      client.get("/test?page=2", headers={"User-Agent": "probe/1.0", "X-Correlation-ID": "hdr-1"})
+
+    started = next(record for record in caplog.records if record.message.startswith("Request started"))
+    assert started.user_agent == "probe/1.0"
+    assert started.query_params == "page=2"
+    assert started.path == "/test"
+
+  def test_request_logs_skipped_when_info_disabled(self, app_with_logging, caplog):
+    """Test request start/completion logs are not emitted above INFO."""
+    client = TestClient(app_with_logging)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.middleware"):
+      response = client.get("/test")
+
+    assert response.status_code == 200
+    assert not any(record.name == "app.core.middleware" for record in caplog.records)
+
+  @pytest.mark.parametrize("log_requests", [True, False])
+  def test_endpoint_correlation_header_replaced(self, log_requests):
+    """Test a correlation header set by the endpoint is replaced rather than duplicated."""
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, log_requests=log_requests)
+
+    @app.get("/test")
+    async def test_endpoint():
+      return JSONResponse({"message": "success"}, headers={"X-Correlation-ID": "from-endpoint"})
+
+    response = TestClient(app).get("/test", headers={"X-Correlation-ID": "from-request"})
+
+    assert response.headers.get_list("X-Correlation-ID") == ["from-request"]
+
+  def test_non_http_scopes_pass_through(self, caplog):
+    """Test lifespan scopes reach the app untouched: no state, context binding or logs."""
+    seen = []
+
+    async def inner_app(scope, receive, send):
+      seen.append((scope, correlation_id_var.get()))
+
+    scope = {"type": "lifespan"}
+    middleware = LoggingMiddleware(inner_app)
 
-class TestCorrelationIDMiddleware:
-  """Tests for lightweight CorrelationIDMiddleware."""
+    with caplog.at_level(logging.DEBUG, logger="app.core.middleware"):
+      asyncio.run(middleware(scope, None, None))
+
+    assert seen == [({"type": "lifespan"}, "no-correlation-id")]
+    assert not any(record.name == "app.core.middleware" for record in caplog.records)
+
+
+class TestCorrelationOnlyMode:
+  """Tests for LoggingMiddleware with request logging disabled."""
 
   @pytest.fixture
   def app_with_correlation(self):
     """Create test app with correlation ID middleware."""
     app = FastAPI()
-    app.add_middleware(CorrelationIDMiddleware)
+    app.add_middleware(LoggingMiddleware, log_requests=False)
 
     @app.get("/test")
     async def test_endpoint():
@@ -157,6 +236,64 @@ class TestCorrelationIDMiddleware:
     data = response.json()
     assert data["correlation_id"] == custom_id
 
+  def test_traceparent_trace_id_used_as_correlation_id(self, app_with_correlation):
+    """Test the W3C traceparent trace-id is reused when no correlation ID is sent."""
+    client = TestClient(app_with_correlation)
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    response = client.get("/test", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+
+    assert response.headers["X-Correlation-ID"] == trace_id
+
+  def test_explicit_correlation_id_beats_traceparent(self, app_with_correlation):
+    """Test X-Correlation-ID takes precedence over traceparent."""
+    client = TestClient(app_with_correlation)
+    headers = {
+      "X-Correlation-ID": "explicit-id",
+      "traceparent": "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+    }
+
+    response = client.get("/test", headers=headers)
+
+    assert response.headers["X-Correlation-ID"] == "explicit-id"
+
+  @pytest.mark.parametrize("traceparent", [
+    "00-00000000000000000000000000000000-00f067aa0ba902b7-01",
+    "00-not-a-trace-id-01",
+    "00-4BF92F3577B34DA6A3CE929D0E0E4736-00f067aa0ba902b7-01",
+  ])
+  def test_malformed_traceparent_ignored(self, app_with_correlation, traceparent):
+    """Test invalid traceparent headers fall back to a generated ID."""
+    client = TestClient(app_with_correlation)
+
+    response = client.get("/test", headers={"traceparent": traceparent})
+
+    correlation_id = response.headers["X-Correlation-ID"]
+    assert len(correlation_id) == 32
+    assert correlation_id not in traceparent
+
+  def test_requests_not_logged(self, app_with_correlation, caplog):
+    """Test that no request/response records are emitted."""
+    client = TestClient(app_with_correlation)
+
+    with caplog.at_level(logging.INFO, logger="app.core.middleware"):
+      response = client.get("/test")
+
+    assert response.status_code == 200
+    assert not any(record.name == "app.core.middleware" for record in caplog.records)
+
+
+class TestAppMiddlewareStack:
+  """Tests for the middleware mounted on the application."""
+
+  def test_no_base_http_middleware(self):
+    """Test the app stack stays pure ASGI so response bodies are not re-streamed."""
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    from app.main import app
+
+    assert not any(issubclass(middleware.cls, BaseHTTPMiddleware) for middleware in app.user_middleware)
+
 
 class TestGetCorrelationId:
   """Tests for get_correlation_id helper function."""
@@ -182,3 +319,26 @@ class TestGetCorrelationId:
     correlation_id = get_correlation_id(request)
 
     assert correlation_id == "no-correlation-id"
+
+  def test_get_correlation_id_falls_back_to_context(self):
+    """Test the context variable is used when no request is given."""
+    token = correlation_id_var.set("ctx-id-456")
+    try:
+      assert get_correlation_id() == "ctx-id-456"
+    finally:
+      correlation_id_var.reset(token)
+
+
+class TestCorrelationIdFilter:
+  """Tests for the correlation ID log filter."""
+
+  def test_filter_stamps_record_from_context(self):
+    """Test records without an explicit correlation_id get the current one."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    token = correlation_id_var.set("log-id-789")
+    try:
+      assert CorrelationIdFilter().filter(record) is True
+    finally:
+      correlation_id_var.reset(token)
+
+    assert record.correlation_id == "log-id-789"
@@ -1,8 +1,15 @@
 """Tests for provider raw_response validation schemas."""
 
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
 import pytest
+from pydantic import BaseModel
 
 from app.core.provider_schemas import (
+  _ensure_dict,
+  _sanitize_json_types,
   validate_anthropic_raw_response,
   validate_google_raw_response,
   validate_openai_raw_response,
@@ -42,3 +49,61 @@ class TestProviderPayloadSchemas:
   def test_google_payload_invalid(self):
     with pytest.raises(ValueError):
       validate_google_raw_response(fixtures.GOOGLE_INVALID)
+
+  @pytest.mark.parametrize(
+    "validator, payload",
+    [
+      (validate_openai_raw_response, fixtures.OPENAI_RESPONSE),
+      (validate_anthropic_raw_response, fixtures.ANTHROPIC_RESPONSE),
+      (validate_google_raw_response, fixtures.GOOGLE_RESPONSE),
+    ],
+  )
+  def test_json_text_matches_dict_payload(self, validator, payload):
+    raw = json.dumps(payload)
+    assert validator(raw) == validator(payload)
+    assert validator(raw.encode("utf-8")) == validator(payload)
+
+  def test_invalid_json_text_raises_value_error(self):
+    with pytest.raises(ValueError, match="Invalid OpenAI raw response"):
+      validate_openai_raw_response("{not json")
+
+
+class TestSanitizeJsonTypes:
+  """Tests for converting SDK payload values into JSON-safe types."""
+
+  def test_converts_bytes_tuples_and_sets(self):
+    payload = {"blob": b"\x00\xff", "pair": (1, {"inner": b"hi"}), "tags": {"a"}}
+    assert _sanitize_json_types(payload) == {"blob": "AP8=", "pair": [1, {"inner": "aGk="}], "tags": ["a"]}
+
+  def test_plain_json_returned_unchanged(self):
+    payload = {"a": [1, {"b": "c"}], "d": None}
+    assert _sanitize_json_types(payload) is payload
+
+  def test_deeply_nested_payload(self):
+    payload = current = {}
+    for _ in range(5000):
+      current["child"] = current = {}
+    current["blob"] = b"x"
+    sanitized = _sanitize_json_types(payload)
+    for _ in range(5000):
+      sanitized = sanitized["child"]
+    assert sanitized == {"blob": "eA=="}
+
+
+class TestEnsureDict:
+  """Tests for coercing SDK payloads into dicts."""
+
+  def test_pydantic_models_dumped_json_safe_without_sanitizing(self):
+    class SdkResponse(BaseModel):
+      id: str
+      created: datetime
+
+    payload = SdkResponse(id="resp_1", created=datetime(2025, 1, 2, tzinfo=timezone.utc))
+    with patch("app.core.provider_schemas._sanitize_json_types") as sanitize:
+      data = _ensure_dict(payload)
+
+    sanitize.assert_not_called()
+    assert data == {"id": "resp_1", "created": "2025-01-02T00:00:00Z"}
+
+  def test_plain_dicts_are_sanitized(self):
+    assert _ensure_dict({"blob": b"hi"}) == {"blob": "aGk="}
@@ -1,9 +1,11 @@
 """Tests for InteractionRepository."""
 
 import pytest
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 
+from app.core.utils import json_deserializer, json_serializer
 from app.models.database import Base
 from app.repositories.interaction_repository import InteractionRepository
 
@@ -11,8 +13,12 @@ from app.repositories.interaction_repository import InteractionRepository
 @pytest.fixture
 def db_session():
   """Create an in-memory SQLite database for testing."""
-  # Create in-memory database
-  engine = create_engine("sqlite:///:memory:")
+  # Create in-memory database (same JSON codecs as the app engine)
+  engine = create_engine(
+    "sqlite:///:memory:",
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+  )
   Base.metadata.create_all(engine)
 
   # Create session
@@ -243,6 +249,151 @@ class TestInteractionRepository:
     state = inspect(results[0])
     assert "raw_response_json" in state.unloaded
 
+  def test_get_recent_query_count_independent_of_rows(self, repository, db_session):
+    """Test listing loads relationships in a fixed number of queries (no N+1)."""
+    for i in range(5):
+      repository.save(
+        prompt_text=f"Prompt {i}",
+        provider_name="openai",
+        model_name="gpt-4o",
+        response_text=f"Response {i}",
+        response_time_ms=1000,
+        search_queries=[{"query": f"q{i}", "sources": [{"url": f"https://example.com/{i}", "rank": 1}]}],
+        sources_used=[{"url": f"https://example.com/{i}", "rank": 1}],
+        raw_response={},
+      )
+    db_session.expire_all()
+
+    statements = []
+
+    def listen(conn, cursor, statement, *args):
+      statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", listen)
+    try:
+      results, _ = repository.get_recent(page_size=5)
+      for response in results:
+        _ = [source.url for query in response.search_queries for source in query.sources]
+        _ = [citation.mentions for citation in response.sources_used]
+        _ = response.response_sources
+        _ = response.interaction.provider.name
+    finally:
+      event.remove(db_session.bind, "before_cursor_execute", listen)
+
+    # count + page query + one IN query per eager-loaded collection
+    assert len(statements) == 7
+
+  def _save_linked_interaction(self, repository):
+    """Save an interaction whose citation links back to a query source."""
+    return repository.save(
+      prompt_text="Linked",
+      provider_name="openai",
+      model_name="gpt-4o",
+      response_text="ok",
+      response_time_ms=1000,
+      search_queries=[{"query": "q", "sources": [{"url": "https://example.com/a", "rank": 1}]}],
+      sources_used=[{"url": "https://example.com/a", "rank": 1}],
+      raw_response={},
+    )
+
+  @pytest.mark.parametrize("loader", ["get_by_id", "get_recent"])
+  def test_loaded_graph_needs_no_further_queries(self, repository, db_session, loader):
+    """Test eager-loaded relationships and identity-map back-references are read without SQL."""
+    response_id = self._save_linked_interaction(repository)
+    db_session.expire_all()
+    response = repository.get_by_id(response_id) if loader == "get_by_id" else repository.get_recent()[0][0]
+
+    statements = []
+
+    def listen(conn, cursor, statement, *args):
+      statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", listen)
+    try:
+      query_source = response.search_queries[0].sources[0]
+      citation = response.sources_used[0]
+      assert citation.query_source is query_source
+      assert query_source.search_query.response is response
+      assert citation.mentions == []
+      assert response.response_sources == []
+      assert response.interaction.provider.name == "openai"
+    finally:
+      event.remove(db_session.bind, "before_cursor_execute", listen)
+
+    assert statements == []
+
+  @pytest.mark.parametrize("loader", ["get_by_id", "get_recent"])
+  def test_unlisted_relationship_raises_instead_of_lazy_loading(self, repository, db_session, loader):
+    """Test relationships outside the eager-load graph raise rather than emit a query."""
+    response_id = self._save_linked_interaction(repository)
+    db_session.expire_all()
+    response = repository.get_by_id(response_id) if loader == "get_by_id" else repository.get_recent()[0][0]
+
+    with pytest.raises(InvalidRequestError, match="not available"):
+      _ = response.citation_mentions
+    with pytest.raises(InvalidRequestError, match="not available"):
+      _ = response.interaction.responses
+
+  def test_raw_response_json_roundtrip(self, repository, db_session):
+    """Test JSON columns round-trip nested, non-ASCII payloads through the Rust codecs."""
+    raw = {"output": [{"text": "café ✓", "score": 0.5, "ids": [1, 2]}], "empty": None}
+    response_id = repository.save(
+      prompt_text="What is AI?",
+      provider_name="openai",
+      model_name="gpt-4o",
+      response_text="AI is...",
+      response_time_ms=1500,
+      search_queries=[],
+      sources_used=[],
+      raw_response=raw,
+      data_source="api",
+      extra_links_count=0
+    )
+    db_session.expire_all()
+
+    assert repository.get_by_id(response_id).raw_response_json == raw
+
+  def test_get_history_stats_aggregates(self, repository):
+    """Test history stats average per-response metrics in a single query."""
+    assert repository.get_history_stats()["analyses"] == 0
+
+    common = dict(
+      prompt_text="What is AI?",
+      provider_name="openai",
+      model_name="gpt-4o",
+      response_text="AI is...",
+      sources_used=[],
+      raw_response={},
+      data_source="api",
+      extra_links_count=0,
+    )
+    repository.save(
+      response_time_ms=1000,
+      search_queries=[{"query": "q1", "sources": []}, {"query": "q2", "sources": []}],
+      sources_found=4,
+      sources_used_count=2,
+      avg_rank=2.0,
+      **common,
+    )
+    repository.save(
+      response_time_ms=3000,
+      search_queries=[],
+      sources_found=0,
+      sources_used_count=0,
+      avg_rank=None,
+      **common,
+    )
+
+    stats = repository.get_history_stats()
+    assert stats == {
+      "analyses": 2,
+      "avg_response_time_ms": 2000.0,
+      "avg_searches": 1.0,
+      "avg_sources_found": 2.0,
+      "avg_sources_used": 1.0,
+      "avg_rank": 2.0,
+    }
+
   def test_delete_existing_interaction(self, repository):
     """Test deleting an existing interaction."""
     # Save an interaction
@@ -368,6 +519,93 @@ class TestInteractionRepository:
     assert citation.citation_confidence == 0.95
     assert citation.metadata_json == {"citation_id": "1"}
 
+  def test_save_inserts_children_in_bulk(self, repository, db_session):
+    """Test child rows are inserted with one statement per table, and citations still link to their sources."""
+    search_queries = [
+      {
+        "query": f"query {q}",
+        "order_index": q,
+        "sources": [{"url": f"https://example.com/{q}/{r}", "rank": r} for r in range(1, 4)],
+      }
+      for q in range(2)
+    ]
+    sources_used = [
+      {"url": "https://example.com/1/2", "rank": 2},
+      {"url": "https://example.com/0/3", "rank": 3},
+    ]
+
+    flushes = []
+    bulk_inserts = []
+
+    def on_flush(session, flush_context):
+      flushes.append(flush_context)
+
+    def on_execute(orm_execute_state):
+      if orm_execute_state.is_insert:
+        bulk_inserts.append(orm_execute_state.statement.table.name)
+
+    event.listen(db_session, "after_flush", on_flush)
+    event.listen(db_session, "do_orm_execute", on_execute)
+    try:
+      response_id = repository.save(
+        prompt_text="Batch",
+        provider_name="openai",
+        model_name="gpt-4o",
+        response_text="ok",
+        response_time_ms=1000,
+        search_queries=search_queries,
+        sources_used=sources_used,
+        raw_response={},
+      )
+    finally:
+      event.remove(db_session, "after_flush", on_flush)
+      event.remove(db_session, "do_orm_execute", on_execute)
+
+    # provider, interaction, response
+    assert len(flushes) == 3
+    assert bulk_inserts == ["search_queries", "query_sources", "sources_used"]
+
+    response = repository.get_by_id(response_id)
+    sources_by_id = {source.id: source for query in response.search_queries for source in query.sources}
+    assert len(sources_by_id) == 6
+    linked = sorted(sources_by_id[citation.query_source_id].url for citation in response.sources_used)
+    assert linked == ["https://example.com/0/3", "https://example.com/1/2"]
+
+  def test_save_links_web_mentions_to_their_citation(self, repository):
+    """Test per-mention snippets are stored against the citation they belong to."""
+    response_text = (
+      "Alpha widgets are the most popular choice today ([Example][1]).\n\n"
+      "Beta gadgets ship with longer warranties overall ([Other][2]).\n\n"
+      "Alpha widgets also come in several colours now ([Example][1]).\n"
+      '\n[1]: https://example.com/a "A"\n'
+      '[2]: https://other.com/b "B"\n'
+    )
+
+    response_id = repository.save(
+      prompt_text="Widgets",
+      provider_name="chatgpt_network",
+      model_name="chatgpt-free",
+      response_text=response_text,
+      response_time_ms=1000,
+      search_queries=[],
+      sources_used=[
+        {"url": "https://example.com/a", "rank": None},
+        {"url": "https://other.com/b", "rank": None},
+      ],
+      raw_response={},
+      data_source="web",
+      sources=[{"url": "https://example.com/a", "rank": 1}],
+    )
+
+    response = repository.get_by_id(response_id)
+    citations = {citation.url: citation for citation in response.sources_used}
+    alpha, beta = citations["https://example.com/a"], citations["https://other.com/b"]
+    assert alpha.response_source_id == response.response_sources[0].id
+    assert [mention.mention_index for mention in alpha.mentions] == [0, 1]
+    assert all(mention.snippet_cited.startswith("Alpha widgets") for mention in alpha.mentions)
+    assert [mention.snippet_cited for mention in beta.mentions] == ["Beta gadgets ship with longer warranties overall"]
+    assert alpha.snippet_cited == alpha.mentions[0].snippet_cited
+
   def test_save_interaction_derives_snippet_from_indices(self, repository):
     """API mode should store indices but not persist snippet_cited."""
     snippet = "Derived snippet"
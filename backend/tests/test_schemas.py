@@ -3,18 +3,26 @@
 import pytest
 from pydantic import ValidationError
 
-from app.api.v1.schemas.requests import BatchRequest, SendPromptRequest
+from app.api.v1.schemas.requests import (
+  BatchRequest,
+  NetworkLogCitation,
+  NetworkLogSearchQuery,
+  NetworkLogSource,
+  SendPromptRequest,
+)
 from app.api.v1.schemas.responses import (
   BatchStatus,
   Citation,
   ErrorResponse,
   HealthResponse,
   InteractionSummary,
+  PaginationMeta,
   ProviderInfo,
   SearchQuery,
   SendPromptResponse,
   Source,
 )
+from app.core.json_schemas import RefId, dump_metadata
 
 
 class TestSendPromptRequest:
@@ -113,6 +121,11 @@ class TestSendPromptRequest:
     )
     assert request.provider == "openai"
 
+  def test_prompt_stripped(self):
+    """Test surrounding whitespace is stripped from the prompt."""
+    request = SendPromptRequest(prompt="  What is AI?\n", provider="openai", model="gpt-5.1")
+    assert request.prompt == "What is AI?"
+
 
 class TestBatchRequest:
   """Tests for BatchRequest schema."""
@@ -168,6 +181,46 @@ class TestBatchRequest:
     assert "100" in str(exc_info.value)
 
 
+class TestNetworkLogSchemas:
+  """Tests for network-log request item schemas."""
+
+  def test_source_metadata_normalized(self):
+    """Test source metadata is validated and None values dropped."""
+    source = NetworkLogSource(
+      url="https://example.com",
+      metadata={"ref_id": {"turn_index": 0, "ref_type": "search"}, "provider": None, "custom": "kept"},
+    )
+    assert source.metadata == {"ref_id": {"turn_index": 0, "ref_type": "search"}, "custom": "kept"}
+
+  def test_source_metadata_none_passthrough(self):
+    """Test missing metadata stays None."""
+    assert NetworkLogSource(url="https://example.com").metadata is None
+
+  def test_source_metadata_invalid(self):
+    """Test invalid metadata is rejected with a clear message."""
+    with pytest.raises(ValidationError) as exc_info:
+      NetworkLogSource(url="https://example.com", metadata={"ref_id": {"turn_index": -1}})
+    assert "invalid metadata payload" in str(exc_info.value).lower()
+
+  def test_citation_metadata_normalized(self):
+    """Test citation metadata is validated and None values dropped."""
+    citation = NetworkLogCitation(url="https://example.com", metadata={"citation_id": "c1", "confidence": None})
+    assert citation.metadata == {"citation_id": "c1"}
+
+  def test_dump_metadata_ref_id_forbids_extra(self):
+    """Test dump_metadata keeps RefId's extra='forbid' behaviour."""
+    assert dump_metadata(RefId, {"turn_index": 1, "ref_type": None}) == {"turn_index": 1}
+    with pytest.raises(ValueError, match="Invalid metadata payload"):
+      dump_metadata(RefId, {"turn_index": 1, "unexpected": True})
+
+  def test_internal_ranking_scores_must_be_object(self):
+    """Test internal_ranking_scores rejects non-object values and keeps None."""
+    assert NetworkLogSearchQuery(query="q").internal_ranking_scores is None
+    with pytest.raises(ValidationError) as exc_info:
+      NetworkLogSearchQuery(query="q", internal_ranking_scores=["not", "a", "dict"])
+    assert "internal_ranking_scores" in str(exc_info.value)
+
+
 class TestResponseSchemas:
   """Tests for response schemas."""
 
@@ -237,6 +290,35 @@ class TestResponseSchemas:
     assert response.response_text == "AI is..."
     assert response.response_time_ms == 1500
 
+  def test_send_prompt_response_passes_raw_json_through(self):
+    """Test pass-through JSON blobs are kept as-is and still serialized."""
+    raw = {"output": [{"type": "message", "content": [{"text": "AI is..."}]}]}
+    response = SendPromptResponse(
+      prompt="What is AI?",
+      response_text="AI is...",
+      provider="openai",
+      model="gpt-5.1",
+      raw_response=raw,
+    )
+    assert response.raw_response is raw
+    assert response.model_dump(mode="json")["raw_response"] == raw
+
+  def test_from_trusted_builds_nested_response(self):
+    """Test from_trusted builds response schemas without validation and serializes them."""
+    source = Source.from_trusted(url="https://example.com", rank=1)
+    query = SearchQuery.from_trusted(query="AI", sources=[source])
+    response = SendPromptResponse.from_trusted(
+      prompt="What is AI?",
+      response_text="AI is...",
+      provider="openai",
+      model="gpt-5.1",
+      search_queries=[query],
+    )
+    assert response.citations == []
+    assert response.data_source == "api"
+    payload = response.model_dump(mode="json")
+    assert payload["search_queries"][0]["sources"][0]["url"] == "https://example.com"
+
   def test_interaction_summary_schema(self):
     """Test InteractionSummary schema."""
     from datetime import datetime
@@ -251,6 +333,21 @@ class TestResponseSchemas:
     assert summary.interaction_id == 1
     assert summary.search_query_count == 0
 
+  def test_pagination_meta_derived_fields(self):
+    """Test PaginationMeta computes page counts and navigation flags."""
+    empty = PaginationMeta(page=1, page_size=10, total_items=0)
+    assert (empty.total_pages, empty.has_next, empty.has_prev) == (0, False, False)
+
+    middle = PaginationMeta(page=2, page_size=10, total_items=25)
+    assert middle.model_dump() == {
+      "page": 2,
+      "page_size": 10,
+      "total_items": 25,
+      "total_pages": 3,
+      "has_next": True,
+      "has_prev": True,
+    }
+
   def test_batch_status_schema(self):
     """Test BatchStatus schema."""
     status = BatchStatus(
@@ -281,6 +378,7 @@ class TestResponseSchemas:
       database="connected"
     )
     assert health.status == "healthy"
+    assert health.timestamp.tzinfo is not None
 
   def test_error_response_schema(self):
     """Test ErrorResponse schema."""
@@ -319,3 +417,18 @@ class TestSchemaExamples:
     example = SendPromptResponse.model_config["json_schema_extra"]["examples"][0]
     response = SendPromptResponse(**example)
     assert response.response_text is not None
+
+
+class TestSchemaBuild:
+  """Tests for response schema build state at import time."""
+
+  def test_response_schemas_complete_at_import(self):
+    """Test nested response schemas resolve their references without a deferred rebuild."""
+    for model in (Source, SearchQuery, Citation, SendPromptResponse, InteractionSummary, PaginationMeta, BatchStatus):
+      assert model.__pydantic_complete__, model.__name__
+
+  def test_unused_schemas_defer_build(self):
+    """Test schemas not served by any route use defer_build and still validate on demand."""
+    for model in (HealthResponse, ErrorResponse):
+      assert model.model_config.get("defer_build") is True
+    assert ErrorResponse(message="Invalid request").status == "error"
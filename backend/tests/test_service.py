@@ -1,11 +1,11 @@
 """Tests for InteractionService business logic."""
 
 from datetime import datetime
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from app.core.utils import calculate_average_rank, extract_domain, normalize_model_name
+from app.core.utils import calculate_average_rank, extract_domain, format_pub_date, normalize_model_name
 from app.services.interaction_service import InteractionService
 
 
@@ -144,6 +144,30 @@ class TestInteractionService:
         raw_response={}
       )
 
+  def test_save_interaction_skips_prevalidated_metadata(self, service, mock_repository):
+    """Test metadata_validated passes already-normalized metadata through untouched."""
+    mock_repository.save.return_value = 1
+    source_metadata = {"ref_id": {"turn_index": 0}, "custom": "kept"}
+
+    with patch("app.services.interaction_service.dump_metadata") as mock_dump:
+      service.save_interaction(
+        prompt="Test",
+        provider="chatgpt",
+        model="chatgpt-free",
+        response_text="Response",
+        response_time_ms=1000,
+        search_queries=[],
+        citations=[{"url": "https://example.com", "metadata": {"citation_id": "c1"}}],
+        raw_response={},
+        data_source="web",
+        sources=[{"url": "https://example.com", "metadata": source_metadata}],
+        metadata_validated=True,
+      )
+
+    mock_dump.assert_not_called()
+    args, kwargs = mock_repository.save.call_args
+    assert kwargs["sources"][0]["metadata"] is source_metadata
+
   def test_save_interaction_invalid_raw_response(self, service):
     """Non-dict raw responses should raise ValueError."""
     with pytest.raises(ValueError):
@@ -353,6 +377,9 @@ class TestInteractionService:
     assert result.interaction_id == 123
     assert len(result.search_queries) == 1
     assert len(result.citations) == 1
+    # API mode: all_sources reuses the per-query source objects
+    assert len(result.all_sources) == 1
+    assert result.all_sources[0] is result.search_queries[0].sources[0]
 
   def test_get_interaction_details_not_found(self, service, mock_repository):
     """Test get_interaction_details returns None when not found."""
@@ -407,6 +434,29 @@ class TestUtilityFunctions:
     # The function works best with simple two-digit versions
     assert normalize_model_name("claude-4-5") == "claude-4.5"
 
+  def test_normalize_model_name_cached(self):
+    """Test repeated model names are served from the cache."""
+    normalize_model_name("gpt-5-1")
+    hits = normalize_model_name.cache_info().hits
+
+    assert normalize_model_name("gpt-5-1") == "gpt-5.1"
+    assert normalize_model_name.cache_info().hits == hits + 1
+
+  def test_provider_factory_resolved_once(self):
+    """Test the lazily imported ProviderFactory is the real class and reused."""
+    from app.core.utils import _provider_factory
+    from app.services.providers.provider_factory import ProviderFactory
+
+    assert _provider_factory() is ProviderFactory
+    assert _provider_factory() is _provider_factory()
+
+  def test_format_pub_date(self):
+    """Test ISO dates (with or without a Z suffix) format and bad input passes through."""
+    assert format_pub_date("2024-01-15T10:30:00Z") == "Mon, Jan 15, 2024 10:30 UTC"
+    assert format_pub_date("2024-01-15T10:30:00") == "Mon, Jan 15, 2024 10:30 UTC"
+    assert format_pub_date("not a date") == "not a date"
+    assert format_pub_date("") == ""
+
   def test_extract_domain_basic(self):
     """Test basic domain extraction."""
     assert extract_domain("https://www.example.com/path") == "example.com"
@@ -422,6 +472,31 @@ class TestUtilityFunctions:
     assert extract_domain("not a url") is None
     assert extract_domain("") is None
 
+  @pytest.mark.parametrize("url", [
+    "https://www.example.com/path?q=1#frag",
+    "http://localhost:8000",
+    "https://user:pw@host.com/a",
+    "https://example.com?next=/other",
+    "https://[::1]:8080/x",
+    "https://[broken/x",
+    "https://exa\tmple.com/",
+    "HTTPS://Example.com/",
+    "//example.com/path",
+    "example.com/path",
+    "https://",
+  ])
+  def test_extract_domain_matches_urlparse(self, url):
+    """Test the http(s) fast path agrees with urlparse-based extraction."""
+    from urllib.parse import urlparse
+
+    try:
+      expected = urlparse(url).netloc
+    except ValueError:
+      expected = ""
+    expected = expected[4:] if expected.startswith("www.") else expected
+
+    assert extract_domain(url) == (expected or None)
+
   def test_calculate_average_rank(self):
     """Test average rank calculation."""
     citations = [
@@ -448,6 +523,11 @@ class TestUtilityFunctions:
     ]
     assert calculate_average_rank(citations) is None
 
+  def test_calculate_average_rank_accepts_dicts(self):
+    """Test citation dicts are averaged by their "rank" key, skipping missing/non-numeric ranks."""
+    citations = [{"rank": 1}, {"rank": None}, {"url": "https://example.com"}, {"rank": "n/a"}, {"rank": 4}]
+    assert calculate_average_rank(citations) == 2.5
+
   def test_calculate_average_rank_empty(self):
     """Test average rank returns None for empty list."""
     assert calculate_average_rank([]) is None